@@ -3,21 +3,25 @@ Deep Research App - Streamlit Entry Point.
 
 This is the main entry point for the Streamlit application.
 Run with: streamlit run app/streamlit_app.py
+(or the `deep-research` console script once the project is installed)
 """
 
-import asyncio
 import logging
 import sys
+from collections import deque
 from pathlib import Path
 from uuid import UUID
 
 import streamlit as st
+from streamlit import runtime
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from app.ui._loop import get_client, run_async
+from app.ui.composer import render_document_composer
+from app.ui.evidence import render_evidence_browser
+from app.ui.progress import LIVE_EVENT_LIMIT, render_progress_log
+from app.ui.runs import render_run_details
 from schemas.config import RunConfig, get_settings
-from storage.supabase import get_supabase_client
+from schemas.models import Run
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,19 +35,38 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Emoji shown next to each run in the sidebar, by run status
+_STATUS_EMOJI = {
+    "created": "🆕",
+    "ingesting": "📥",
+    "researching": "🔍",
+    "drafting": "✍️",
+    "complete": "✅",
+    "failed": "❌",
+}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_runs(limit: int) -> list[Run]:
+    """Fetch recent runs, cached briefly so reruns skip the round-trip."""
+    return run_async(get_client().list_runs(limit=limit))
+
 
 def init_session_state():
     """Initialize session state variables."""
-    if "current_run_id" not in st.session_state:
-        st.session_state.current_run_id = None
-    if "current_run" not in st.session_state:
-        st.session_state.current_run = None
-    if "agent_running" not in st.session_state:
-        st.session_state.agent_running = False
-    if "events" not in st.session_state:
-        st.session_state.events = []
-    if "document" not in st.session_state:
-        st.session_state.document = None
+    defaults = {
+        "current_run_id": None,
+        "current_run": None,
+        "agent_running": False,
+        "events": deque(maxlen=LIVE_EVENT_LIMIT),
+        "document": None,
+        # Which run the run table's row selection reflects, and a counter
+        # that remounts the table when that goes stale
+        "run_table_run_id": None,
+        "run_table_version": 0,
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
 
 
 def render_sidebar():
@@ -104,12 +127,13 @@ def create_new_run(title: str, objective: str, constraints: str):
             constraints=constraints if constraints else None,
         )
 
-        client = get_supabase_client()
-        run = asyncio.run(client.create_run(config))
+        client = get_client()
+        run = run_async(client.create_run(config))
 
         st.session_state.current_run_id = run.id
         st.session_state.current_run = run
         st.success(f"Created run: {title}")
+        _fetch_runs.clear()
         st.rerun()
 
     except Exception as e:
@@ -120,48 +144,58 @@ def create_new_run(title: str, objective: str, constraints: str):
 def render_run_list():
     """Render the list of existing runs."""
     try:
-        client = get_supabase_client()
-        runs = asyncio.run(client.list_runs(limit=10))
+        runs = _fetch_runs(limit=10)
 
         if not runs:
             st.info("No runs yet. Create one above!")
             return
 
-        for run in runs:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                if st.button(
-                    f"📁 {run.title}",
-                    key=f"run_{run.id}",
-                    use_container_width=True,
-                    type="secondary" if str(run.id) != str(st.session_state.current_run_id) else "primary",
-                ):
-                    st.session_state.current_run_id = run.id
-                    st.session_state.current_run = run
-                    st.rerun()
-
-            with col2:
-                status_emoji = {
-                    "created": "🆕",
-                    "ingesting": "📥",
-                    "researching": "🔍",
-                    "drafting": "✍️",
-                    "complete": "✅",
-                    "failed": "❌",
-                }.get(run.status, "❓")
-                st.caption(status_emoji)
+        # A dataframe's selection can't be set from code, so when the current
+        # run changed elsewhere (e.g. a new run was created) remount the table
+        # under a fresh key to drop the stale highlighted row
+        if st.session_state.run_table_run_id != st.session_state.current_run_id:
+            st.session_state.run_table_run_id = st.session_state.current_run_id
+            st.session_state.run_table_version += 1
+        table_key = f"run_table_{st.session_state.run_table_version}"
+
+        def select_run():
+            rows = st.session_state[table_key].selection.rows
+            if rows:
+                st.session_state.current_run_id = runs[rows[0]].id
+                st.session_state.current_run = runs[rows[0]]
+                st.session_state.run_table_run_id = runs[rows[0]].id
+
+        st.dataframe(
+            [
+                {"Status": _STATUS_EMOJI.get(run.status, "❓"), "Run": run.title}
+                for run in runs
+            ],
+            key=table_key,
+            on_select=select_run,
+            selection_mode="single-row",
+            hide_index=True,
+            use_container_width=True,
+        )
 
     except Exception as e:
         st.error(f"Failed to load runs: {e}")
 
 
-def render_settings():
-    """Render the settings panel."""
+@st.cache_resource
+def _settings_display() -> dict[str, str]:
+    """Read the settings shown in the sidebar once per process."""
     settings = get_settings()
+    return {
+        "Supabase URL": settings.supabase_url or "",
+        "Anthropic API": "✓ Set" if settings.anthropic_api_key else "Not set",
+        "OpenAI API": "✓ Set" if settings.openai_api_key else "Not set",
+    }
 
-    st.text_input("Supabase URL", value=settings.supabase_url or "", disabled=True)
-    st.text_input("Anthropic API", value="✓ Set" if settings.anthropic_api_key else "Not set", disabled=True)
-    st.text_input("OpenAI API", value="✓ Set" if settings.openai_api_key else "Not set", disabled=True)
+
+def render_settings():
+    """Render the settings panel."""
+    for label, value in _settings_display().items():
+        st.text_input(label, value=value, disabled=True)
 
 
 def render_main_content():
@@ -203,10 +237,6 @@ def render_welcome():
 
 def render_left_pane():
     """Render the left pane with evidence and controls."""
-    from app.ui.evidence import render_evidence_browser
-    from app.ui.runs import render_run_details
-    from app.ui.progress import render_progress_log
-
     # Tab navigation
     tab1, tab2, tab3 = st.tabs(["📄 Run", "🔍 Evidence", "📋 Log"])
 
@@ -222,13 +252,18 @@ def render_left_pane():
 
 def render_right_pane():
     """Render the right pane with document composer."""
-    from app.ui.composer import render_document_composer
-
     render_document_composer()
 
 
 def main():
     """Main application entry point."""
+    if not runtime.exists():
+        # Invoked as the `deep-research` console script: hand off to Streamlit
+        from streamlit.web import cli as stcli
+
+        sys.argv = ["streamlit", "run", str(Path(__file__).resolve())]
+        sys.exit(stcli.main())
+
     init_session_state()
     render_sidebar()
     render_main_content()
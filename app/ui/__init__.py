@@ -6,12 +6,20 @@ Modules:
 - evidence: Evidence browser (search, filter, preview)
 - composer: Document composer (preview, edit, diff)
 - progress: Real-time progress display
+
+Components are imported on first attribute access (PEP 562), so importing
+one submodule does not pull in the others.
 """
 
-from app.ui.composer import render_document_composer
-from app.ui.evidence import render_evidence_browser
-from app.ui.progress import render_progress_log
-from app.ui.runs import render_run_details
+import importlib
+from typing import Any
+
+_COMPONENTS = {
+    "render_run_details": "app.ui.runs",
+    "render_evidence_browser": "app.ui.evidence",
+    "render_document_composer": "app.ui.composer",
+    "render_progress_log": "app.ui.progress",
+}
 
 __all__ = [
     "render_run_details",
@@ -19,3 +27,11 @@ __all__ = [
     "render_document_composer",
     "render_progress_log",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import a UI component from its submodule."""
+    module_path = _COMPONENTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path), name)
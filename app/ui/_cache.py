@@ -0,0 +1,66 @@
+"""
+Cached Supabase reads shared by the UI components.
+
+Several panels read the same run data (the run tab and the evidence browser
+both list sources), so the cached fetchers live here where every reader and
+writer can reach the same cache entries. TTLs are short; writers clear the
+affected cache explicitly.
+"""
+
+from uuid import UUID
+
+import streamlit as st
+
+from app.ui._loop import get_client, run_async
+from schemas.models import Chunk, Source
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_sources(run_id: UUID, limit: int | None = None) -> list[Source]:
+    """Sources ingested for a run, optionally only the first few."""
+    return run_async(get_client().get_sources(run_id, limit=limit))
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_source_count(run_id: UUID) -> int:
+    """Number of sources ingested for a run."""
+    return run_async(get_client().get_source_count(run_id))
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_chunks(
+    run_id: UUID,
+    source_id: UUID | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[Chunk]:
+    """A page of chunks for a run, optionally limited to one source (no embeddings)."""
+    return run_async(
+        get_client().get_chunks(
+            run_id,
+            source_id=source_id,
+            limit=limit,
+            offset=offset,
+            with_embedding=False,
+        )
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_chunk_count(run_id: UUID, source_id: UUID | None = None) -> int:
+    """Number of chunks for a run, optionally limited to one source."""
+    return run_async(get_client().get_chunk_count(run_id, source_id=source_id))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_chunk(chunk_id: UUID) -> Chunk | None:
+    """A single chunk; chunks are never edited once stored, so no TTL."""
+    return run_async(get_client().get_chunk(chunk_id))
+
+
+def clear_ingestion_caches() -> None:
+    """Drop cached sources and chunks after new material is ingested."""
+    cached_sources.clear()
+    cached_source_count.clear()
+    cached_chunks.clear()
+    cached_chunk_count.clear()
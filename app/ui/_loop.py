@@ -0,0 +1,68 @@
+"""
+Shared async runtime for the Streamlit UI.
+
+Streamlit reruns the script on every interaction, so calling
+``asyncio.run`` per Supabase call builds and tears down an event loop each
+time. This module keeps one loop running on a background thread for the
+whole process and hands out a single Supabase client.
+"""
+
+import asyncio
+import sys
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any
+
+import streamlit as st
+
+from storage.supabase import SupabaseClient, get_supabase_client
+
+# uvloop is optional (the "uvloop" extra) and unavailable on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Start the event loop shared by all sessions on a background thread."""
+    if uvloop is not None and sys.platform != "win32":
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="app-event-loop", daemon=True).start()
+    return loop
+
+
+def submit[T](coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """
+    Schedule a coroutine on the shared event loop without waiting for it.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        A concurrent.futures.Future for the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    return submit(coro).result()
+
+
+@st.cache_resource
+def get_client() -> SupabaseClient:
+    """Get the Supabase client, shared across reruns and sessions."""
+    return get_supabase_client()
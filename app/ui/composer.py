@@ -4,19 +4,26 @@ Document composer UI component.
 Displays the document preview, editor, and diff views.
 """
 
-import asyncio
+import json
 import logging
+import re
 from datetime import datetime
 from uuid import UUID
 
 import streamlit as st
 
+from app.ui._loop import get_client, run_async
 from services.citation import CitationService
 from services.versioning import VersioningService
-from storage.supabase import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+_CITATION_RE = re.compile(r'\[(\d+)\]')
+_REFS_RE = re.compile(r'## References\s*\n(.*)', re.DOTALL)
+
+# Unified diff lines shown before the rest is hidden behind a toggle
+_DIFF_PREVIEW_LINES = 500
+
 
 def render_document_composer():
     """Render the document composer panel."""
@@ -36,33 +43,72 @@ def render_document_composer():
     # Version selector
     render_version_selector(documents)
 
+    # Index versions once so each tab can look up the current document directly
+    version_index = {d.version: d for d in documents}
+
     # Main tabs
     tab1, tab2, tab3, tab4 = st.tabs(["👁️ Preview", "✏️ Edit", "📊 Diff", "📚 Citations"])
 
     with tab1:
-        render_preview_tab(documents)
+        render_preview_tab(documents, version_index)
 
     with tab2:
-        render_edit_tab(documents)
+        render_edit_tab(documents, version_index)
 
     with tab3:
-        render_diff_tab(documents)
+        render_diff_tab(documents, version_index)
 
     with tab4:
-        render_citations_tab(documents)
+        render_citations_tab(documents, version_index)
 
     # Export options
-    render_export_options(documents)
+    render_export_options(documents, version_index)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_documents_cached(run_id: UUID):
+    """Fetch a run's document versions, cached until a new version is written."""
+    return run_async(get_client().get_document_versions(run_id))
+
+
+@st.cache_resource
+def _citation_service() -> CitationService:
+    """Shared citation service, used only for its stateless coverage check."""
+    return CitationService()
+
+
+@st.cache_resource
+def _versioning_service() -> VersioningService:
+    """Shared versioning service, used only for its stateless diff helpers."""
+    return VersioningService()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _coverage_for(doc_id: UUID, version: int, _markdown: str):
+    """Coverage report for one document version (versions are immutable)."""
+    return _citation_service().calculate_coverage(_markdown)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _version_diff(
+    from_id: UUID,
+    from_version: int,
+    to_id: UUID,
+    to_version: int,
+    _from_doc,
+    _to_doc,
+):
+    """Diff and per-section changes between two versions, keyed on ids and versions."""
+    versioning = _versioning_service()
+    diff = versioning.compute_version_diff(_from_doc, _to_doc)
+    section_changes = versioning.get_section_changes(_from_doc.markdown, _to_doc.markdown)
+    return diff, section_changes
 
 
 def load_documents():
     """Load documents for the current run."""
     try:
-        client = get_supabase_client()
-        documents = asyncio.run(
-            client.get_document_versions(st.session_state.current_run_id)
-        )
-        return documents
+        return _load_documents_cached(st.session_state.current_run_id)
     except Exception as e:
         st.error(f"Failed to load documents: {e}")
         return []
@@ -97,7 +143,7 @@ def create_manual_draft():
         from schemas.models import Document
         from uuid import uuid4
 
-        client = get_supabase_client()
+        client = get_client()
         run = st.session_state.current_run
 
         if not run:
@@ -119,14 +165,24 @@ def create_manual_draft():
             ),
         )
 
-        asyncio.run(client.store_document(doc))
+        run_async(client.store_document(doc))
         st.success("Draft created!")
+        _load_documents_cached.clear()
         st.rerun()
 
     except Exception as e:
         st.error(f"Failed to create draft: {e}")
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _version_labels(doc_ids: tuple[UUID, ...], _documents) -> dict[int, str]:
+    """Selectbox labels for a set of document versions, keyed on their ids."""
+    return {
+        d.version: f"v{d.version} - {d.created_at.strftime('%Y-%m-%d %H:%M')}"
+        for d in _documents
+    }
+
+
 def render_version_selector(documents):
     """Render the version selector."""
     if len(documents) <= 1:
@@ -135,7 +191,7 @@ def render_version_selector(documents):
     col1, col2 = st.columns([3, 1])
 
     with col1:
-        versions = {d.version: f"v{d.version} - {d.created_at.strftime('%Y-%m-%d %H:%M')}" for d in documents}
+        versions = _version_labels(tuple(d.id for d in documents), documents)
         selected_version = st.selectbox(
             "Version",
             options=sorted(versions.keys(), reverse=True),
@@ -148,22 +204,20 @@ def render_version_selector(documents):
         st.caption(f"{len(documents)} versions")
 
 
-def get_current_document(documents):
+def get_current_document(version_index, documents):
     """Get the currently selected document."""
     version = st.session_state.get("current_document_version")
 
-    if version:
-        for doc in documents:
-            if doc.version == version:
-                return doc
+    if version and version in version_index:
+        return version_index[version]
 
     # Default to latest
     return documents[-1] if documents else None
 
 
-def render_preview_tab(documents):
+def render_preview_tab(documents, version_index):
     """Render the preview tab."""
-    doc = get_current_document(documents)
+    doc = get_current_document(version_index, documents)
 
     if not doc:
         st.info("No document to preview")
@@ -187,9 +241,10 @@ def render_preview_tab(documents):
     st.markdown(doc.markdown)
 
 
-def render_edit_tab(documents):
+@st.fragment
+def render_edit_tab(documents, version_index):
     """Render the edit tab."""
-    doc = get_current_document(documents)
+    doc = get_current_document(version_index, documents)
 
     if not doc:
         st.info("No document to edit")
@@ -227,8 +282,8 @@ def render_edit_tab(documents):
 def save_new_version(doc, content: str, description: str):
     """Save a new document version."""
     try:
-        from services.versioning import VersioningService
-
+        # A fresh instance: create_revision records into the service's change
+        # history, which must not accumulate in the shared cached service
         versioning = VersioningService()
         new_doc = versioning.create_revision(
             previous=doc,
@@ -237,17 +292,19 @@ def save_new_version(doc, content: str, description: str):
             change_description=description or "Manual edit",
         )
 
-        client = get_supabase_client()
-        asyncio.run(client.store_document(new_doc))
+        client = get_client()
+        run_async(client.store_document(new_doc))
 
         st.success(f"Saved as version {new_doc.version}")
+        _load_documents_cached.clear()
         st.rerun()
 
     except Exception as e:
         st.error(f"Failed to save: {e}")
 
 
-def render_diff_tab(documents):
+@st.fragment
+def render_diff_tab(documents, version_index):
     """Render the diff tab."""
     if len(documents) < 2:
         st.info("Need at least 2 versions to compare")
@@ -255,7 +312,7 @@ def render_diff_tab(documents):
 
     col1, col2 = st.columns(2)
 
-    versions = sorted([d.version for d in documents])
+    versions = sorted(version_index)
 
     with col1:
         from_version = st.selectbox(
@@ -274,21 +331,27 @@ def render_diff_tab(documents):
             key="diff_to",
         )
 
+    # Remember the compared pair so the diff survives reruns, such as
+    # revealing the full diff below
     if st.button("Compare", use_container_width=True):
-        show_diff(documents, from_version, to_version)
+        st.session_state.diff_versions = (from_version, to_version)
 
+    if st.session_state.get("diff_versions") == (from_version, to_version):
+        show_diff(version_index, from_version, to_version)
 
-def show_diff(documents, from_version: int, to_version: int):
+
+def show_diff(version_index, from_version: int, to_version: int):
     """Show diff between two versions."""
-    from_doc = next((d for d in documents if d.version == from_version), None)
-    to_doc = next((d for d in documents if d.version == to_version), None)
+    from_doc = version_index.get(from_version)
+    to_doc = version_index.get(to_version)
 
     if not from_doc or not to_doc:
         st.error("Version not found")
         return
 
-    versioning = VersioningService()
-    diff = versioning.compute_version_diff(from_doc, to_doc)
+    diff, section_changes = _version_diff(
+        from_doc.id, from_doc.version, to_doc.id, to_doc.version, from_doc, to_doc
+    )
 
     # Summary
     st.markdown(f"### Changes: v{from_version} → v{to_version}")
@@ -307,28 +370,36 @@ def show_diff(documents, from_version: int, to_version: int):
 
     # Unified diff
     st.markdown("### Unified Diff")
-    st.code(diff.unified_diff, language="diff")
+    diff_lines = diff.unified_diff.splitlines(keepends=True)
+    st.code("".join(diff_lines[:_DIFF_PREVIEW_LINES]), language="diff")
+
+    if len(diff_lines) > _DIFF_PREVIEW_LINES:
+        remaining = len(diff_lines) - _DIFF_PREVIEW_LINES
+        # A collapsed expander would still send every line, so the rest of
+        # the diff is only rendered once asked for
+        if st.toggle(
+            f"Show full diff ({remaining} more lines)",
+            key=f"full_diff_{from_version}_{to_version}",
+        ):
+            st.code("".join(diff_lines[_DIFF_PREVIEW_LINES:]), language="diff")
 
     # Section changes
-    section_changes = versioning.get_section_changes(from_doc.markdown, to_doc.markdown)
-
     if section_changes:
         st.markdown("### Section Changes")
         for section, change in section_changes.items():
             st.markdown(f"- **{section}:** {change}")
 
 
-def render_citations_tab(documents):
+def render_citations_tab(documents, version_index):
     """Render the citations tab."""
-    doc = get_current_document(documents)
+    doc = get_current_document(version_index, documents)
 
     if not doc:
         st.info("No document to analyze")
         return
 
     # Citation coverage
-    citation_service = CitationService()
-    report = citation_service.calculate_coverage(doc.markdown)
+    report = _coverage_for(doc.id, doc.version, doc.markdown)
 
     st.markdown("### Citation Coverage")
 
@@ -370,31 +441,46 @@ def render_citations_tab(documents):
     render_citation_list(doc)
 
 
+@st.cache_data(show_spinner=False)
+def _extract_citations(markdown: str) -> tuple[int, str | None]:
+    """Count distinct cited reference numbers and extract the References body."""
+    citation_count = len({int(m.group(1)) for m in _CITATION_RE.finditer(markdown)})
+    refs_match = _REFS_RE.search(markdown)
+    return citation_count, refs_match.group(1) if refs_match else None
+
+
 def render_citation_list(doc):
     """Render the list of citations in the document."""
-    import re
-
-    # Find all citations in the format [N]
-    citations = re.findall(r'\[(\d+)\]', doc.markdown)
-    unique_citations = sorted(set(int(c) for c in citations))
+    # Find all citations in the format [N], plus the references section
+    citation_count, refs_content = _extract_citations(doc.markdown)
 
-    if not unique_citations:
+    if not citation_count:
         st.info("No resolved citations found")
         return
 
-    # Find references section
-    refs_match = re.search(r'## References\s*\n(.*)', doc.markdown, re.DOTALL)
-
-    if refs_match:
-        refs_content = refs_match.group(1)
+    if refs_content is not None:
         st.markdown(refs_content)
     else:
-        st.info(f"Found {len(unique_citations)} citation references")
+        st.info(f"Found {citation_count} citation references")
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _export_json(doc_id: UUID, version: int, _doc) -> str:
+    """JSON export payload for one document version."""
+    export_data = {
+        "title": _doc.title,
+        "version": _doc.version,
+        "created_at": _doc.created_at.isoformat(),
+        "markdown": _doc.markdown,
+        "change_log": _doc.change_log,
+    }
+    return json.dumps(export_data, indent=2)
 
 
-def render_export_options(documents):
+@st.fragment
+def render_export_options(documents, version_index):
     """Render export options."""
-    doc = get_current_document(documents)
+    doc = get_current_document(version_index, documents)
 
     if not doc:
         return
@@ -416,17 +502,9 @@ def render_export_options(documents):
 
     with col2:
         # JSON export
-        import json
-        export_data = {
-            "title": doc.title,
-            "version": doc.version,
-            "created_at": doc.created_at.isoformat(),
-            "markdown": doc.markdown,
-            "change_log": doc.change_log,
-        }
         st.download_button(
             "📦 Download JSON",
-            data=json.dumps(export_data, indent=2),
+            data=_export_json(doc.id, doc.version, doc),
             file_name=f"{doc.title.replace(' ', '_')}_v{doc.version}.json",
             mime="application/json",
             use_container_width=True,
@@ -4,18 +4,37 @@ Evidence browser UI component.
 Displays search interface and evidence chunks from ingested sources.
 """
 
-import asyncio
 import logging
 from uuid import UUID
 
 import streamlit as st
 
+from app.ui._cache import cached_chunk, cached_chunk_count, cached_chunks, cached_sources
+from app.ui._loop import get_client, run_async
 from retrieval.hybrid_search import HybridSearcher
 from schemas.config import RetrievalConfig
-from storage.supabase import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Search results rendered per "Show more" step; later results stay unrendered
+# until asked for
+_RESULTS_PAGE_SIZE = 10
+
+
+@st.cache_resource
+def _searcher(search_type: str, use_rerank: bool) -> HybridSearcher:
+    """One searcher (and embedding client) per search configuration."""
+    config = RetrievalConfig(
+        search_type=search_type,
+        use_reranking=use_rerank,
+    )
+    return HybridSearcher(config, client=get_client())
+
+
+def _preview(content: str, limit: int) -> str:
+    """Shorten chunk text for a card, marking the cut with an ellipsis."""
+    return content[:limit] + "..." if len(content) > limit else content
+
 
 def render_evidence_browser():
     """Render the evidence browser panel."""
@@ -35,6 +54,7 @@ def render_evidence_browser():
         render_chunk_browser()
 
 
+@st.fragment
 def render_search_interface():
     """Render the search input interface."""
     st.subheader("🔍 Search Evidence")
@@ -90,13 +110,9 @@ def execute_search(query: str, search_type: str, top_k: int, use_rerank: bool):
     """Execute a search query."""
     try:
         with st.spinner("Searching..."):
-            config = RetrievalConfig(
-                search_type=search_type,
-                use_reranking=use_rerank,
-            )
-            searcher = HybridSearcher(config)
+            searcher = _searcher(search_type, use_rerank)
 
-            results = asyncio.run(
+            results = run_async(
                 searcher.search(
                     query=query,
                     run_id=st.session_state.current_run_id,
@@ -106,41 +122,38 @@ def execute_search(query: str, search_type: str, top_k: int, use_rerank: bool):
 
             st.session_state.search_results = results
             st.session_state.search_query = query
+            st.session_state.search_results_shown = _RESULTS_PAGE_SIZE
+
+        # Results render outside the search fragment, so rerun the whole app
+        st.rerun()
 
     except Exception as e:
         st.error(f"Search failed: {e}")
         logger.exception("Search failed")
 
 
+@st.fragment
 def render_search_results():
     """Render search results."""
     results = st.session_state.search_results
     query = st.session_state.get("search_query", "")
 
-    st.markdown(f"**{len(results)} results for:** *{query}*")
+    shown = st.session_state.get("search_results_shown", _RESULTS_PAGE_SIZE)
 
-    for i, result in enumerate(results):
-        with st.container():
-            # Result header
-            col1, col2 = st.columns([4, 1])
-
-            with col1:
-                title = result.source_title[:50] if result.source_title else "Unknown"
-                st.markdown(f"**{i + 1}. {title}**")
+    st.markdown(f"**{len(results)} results for:** *{query}*")
 
-            with col2:
-                st.caption(f"Score: {result.score:.3f}")
+    for i, result in enumerate(results[:shown]):
+        title = result.source_title[:50] if result.source_title else "Unknown"
 
+        # Only the top few results start open; collapsed expanders still send
+        # their contents, so results past `shown` aren't rendered at all
+        with st.expander(f"{i + 1}. {title} — score {result.score:.3f}", expanded=i < 3):
             # Location info
             if result.page_start:
                 st.caption(f"📍 {result.location_str}")
 
             # Content preview
-            content = result.content
-            if len(content) > 300:
-                content = content[:300] + "..."
-
-            st.markdown(f"> {content}")
+            st.markdown(f"> {_preview(result.content, 300)}")
 
             # Action buttons
             col1, col2, col3 = st.columns(3)
@@ -158,16 +171,26 @@ def render_search_results():
                     citation = f"[cite:{result.chunk_id}]"
                     st.code(citation)
 
-            st.markdown("---")
+    if len(results) > shown:
+        st.button(
+            f"Show more ({len(results) - shown} remaining)",
+            key="more_results",
+            on_click=_show_more_results,
+            args=(shown,),
+        )
 
 
+def _show_more_results(shown: int):
+    """Reveal the next page of search results."""
+    st.session_state.search_results_shown = shown + _RESULTS_PAGE_SIZE
+
+
+@st.fragment
 def render_chunk_browser():
     """Render the chunk browser for browsing without search."""
     try:
-        client = get_supabase_client()
-
         # Get sources first
-        sources = asyncio.run(client.get_sources(st.session_state.current_run_id))
+        sources = cached_sources(st.session_state.current_run_id)
 
         if not sources:
             st.info("No sources ingested yet. Add PDFs or URLs to get started.")
@@ -184,31 +207,29 @@ def render_chunk_browser():
             key="source_filter",
         )
 
-        # Get chunks
-        if selected_source == "All":
-            chunks = asyncio.run(client.get_chunks(st.session_state.current_run_id))
-        else:
-            chunks = asyncio.run(client.get_chunks(
-                st.session_state.current_run_id,
-                source_id=UUID(selected_source)
-            ))
+        run_id = st.session_state.current_run_id
+        source_id = None if selected_source == "All" else UUID(selected_source)
+
+        # Count chunks, then fetch only the current page
+        total_chunks = cached_chunk_count(run_id, source_id=source_id)
 
-        if not chunks:
+        if not total_chunks:
             st.info("No chunks found")
             return
 
         # Pagination
         page_size = 10
-        total_pages = (len(chunks) + page_size - 1) // page_size
+        total_pages = (total_chunks + page_size - 1) // page_size
         page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
 
         start_idx = (page - 1) * page_size
-        end_idx = min(start_idx + page_size, len(chunks))
+        chunks = cached_chunks(run_id, source_id=source_id, limit=page_size, offset=start_idx)
+        end_idx = start_idx + len(chunks)
 
-        st.caption(f"Showing {start_idx + 1}-{end_idx} of {len(chunks)} chunks")
+        st.caption(f"Showing {start_idx + 1}-{end_idx} of {total_chunks} chunks")
 
         # Display chunks
-        for chunk in chunks[start_idx:end_idx]:
+        for chunk in chunks:
             render_chunk_card(chunk)
 
     except Exception as e:
@@ -233,10 +254,7 @@ def render_chunk_card(chunk):
                 st.caption(f"p.{chunk.page_start}")
 
         # Content preview
-        content = chunk.content
-        if len(content) > 200:
-            content = content[:200] + "..."
-        st.markdown(f"> {content}")
+        st.markdown(f"> {_preview(chunk.content, 200)}")
 
         # Metadata
         st.caption(f"Tokens: {chunk.token_count} | ID: {str(chunk.id)[:8]}...")
@@ -245,16 +263,16 @@ def render_chunk_card(chunk):
 
 
 def show_full_chunk(chunk_id: UUID):
-    """Show full chunk content in a modal-like expander."""
+    """Show full chunk content in a bordered container (results are already expanders)."""
     try:
-        client = get_supabase_client()
-        chunk = asyncio.run(client.get_chunk(chunk_id))
+        chunk = cached_chunk(chunk_id)
 
         if not chunk:
             st.error("Chunk not found")
             return
 
-        with st.expander(f"Full content: {str(chunk_id)[:8]}...", expanded=True):
+        with st.container(border=True):
+            st.markdown(f"**Full content: {str(chunk_id)[:8]}...**")
             st.markdown(chunk.content)
 
             if chunk.contextual_prefix:
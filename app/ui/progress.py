@@ -4,21 +4,50 @@ Progress log UI component.
 Displays real-time progress from agent execution.
 """
 
-import asyncio
 import logging
+from collections import Counter, deque
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 import streamlit as st
 
-from storage.supabase import get_supabase_client
+from app.ui._loop import get_client, run_async
 
 logger = logging.getLogger(__name__)
 
-
+# Events kept in session state for display; older ones still count in the stats
+_EVENT_LOG_LIMIT = 200
+
+# Live agent events kept in st.session_state.events (a bounded deque)
+LIVE_EVENT_LIMIT = 100
+
+# Event headers that don't mention the node
+_STATIC_HEADERS = {
+    "run_start": "Research run started",
+    "run_complete": "Research run completed",
+    "run_error": "Research run failed",
+    "citation": "Processing citations",
+}
+
+# Event headers filled in with the event's node name
+_HEADER_TEMPLATES = {
+    "tool_call": "Calling tool: {node_name}",
+    "tool_result": "Tool result: {node_name}",
+    "search": "Searching: {node_name}",
+    "ingestion": "Ingesting: {node_name}",
+    "draft": "Drafting: {node_name}",
+    "critique": "Critiquing: {node_name}",
+    "node_start": "Starting: {node_name}",
+    "node_end": "Completed: {node_name}",
+    "subagent_start": "Subagent started: {node_name}",
+    "subagent_end": "Subagent completed: {node_name}",
+}
+
+
+@st.fragment
 def render_progress_log():
-    """Render the progress log panel."""
+    """Render the progress log panel (reruns on its own, not with the app)."""
     if not st.session_state.current_run_id:
         st.info("Select a run to view progress")
         return
@@ -34,23 +63,42 @@ def render_progress_log():
     # Load and display events
     render_event_log()
 
-    # Manual refresh
-    if st.button("🔄 Refresh Log", use_container_width=True):
-        st.rerun()
+    # Manual refresh: clicking reruns only this fragment
+    st.button("🔄 Refresh Log", use_container_width=True)
+
+
+def load_event_log(run_id: UUID) -> dict[str, Any]:
+    """Fetch events logged since the last refresh and merge them into session state."""
+    log = st.session_state.get("event_log")
+    if log is None or log["run_id"] != run_id:
+        log = {"run_id": run_id, "events": [], "counts": Counter()}
+        st.session_state.event_log = log
+
+    since = log["events"][-1].ts if log["events"] else None
+    new_events = run_async(get_client().get_events(run_id, since=since))
+
+    # The since filter is inclusive, so drop events already seen at that timestamp
+    seen = {event.id for event in log["events"] if event.ts == since}
+    new_events = [event for event in new_events if event.id not in seen]
+
+    log["events"].extend(new_events)
+    del log["events"][:-_EVENT_LOG_LIMIT]
+    log["counts"].update(event.type for event in new_events)
+    return log
 
 
 def render_event_log():
     """Render the event log."""
     try:
-        client = get_supabase_client()
-        events = asyncio.run(client.get_events(st.session_state.current_run_id))
+        log = load_event_log(st.session_state.current_run_id)
+        events = log["events"]
 
         if not events:
             st.info("No events yet. Start the agent to see progress.")
             return
 
         # Summary stats
-        render_event_stats(events)
+        render_event_stats(log["counts"])
 
         st.markdown("---")
 
@@ -63,18 +111,12 @@ def render_event_log():
         logger.exception("Event loading failed")
 
 
-def render_event_stats(events):
-    """Render summary statistics for events."""
-    # Count by type
-    type_counts = {}
-    for event in events:
-        event_type = event.type
-        type_counts[event_type] = type_counts.get(event_type, 0) + 1
-
+def render_event_stats(type_counts: Counter):
+    """Render summary statistics from per-type event counts."""
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Total Events", len(events))
+        st.metric("Total Events", sum(type_counts.values()))
 
     with col2:
         tool_calls = type_counts.get("tool_call", 0) + type_counts.get("tool_result", 0)
@@ -137,26 +179,13 @@ def render_event_card(event):
 def format_event_header(event) -> str:
     """Format the event header text."""
     event_type = event.type
-    node_name = event.node_name or ""
-
-    headers = {
-        "run_start": "Research run started",
-        "run_complete": "Research run completed",
-        "run_error": "Research run failed",
-        "tool_call": f"Calling tool: {node_name}",
-        "tool_result": f"Tool result: {node_name}",
-        "search": f"Searching: {node_name}",
-        "ingestion": f"Ingesting: {node_name}",
-        "draft": f"Drafting: {node_name}",
-        "critique": f"Critiquing: {node_name}",
-        "citation": "Processing citations",
-        "node_start": f"Starting: {node_name}",
-        "node_end": f"Completed: {node_name}",
-        "subagent_start": f"Subagent started: {node_name}",
-        "subagent_end": f"Subagent completed: {node_name}",
-    }
 
-    return headers.get(event_type, f"{event_type}: {node_name}")
+    header = _STATIC_HEADERS.get(event_type)
+    if header is not None:
+        return header
+
+    template = _HEADER_TEMPLATES.get(event_type, "{event_type}: {node_name}")
+    return template.format(event_type=event_type, node_name=event.node_name or "")
 
 
 def render_event_details(event):
@@ -229,13 +258,13 @@ def render_live_stream():
     live_placeholder = st.empty()
 
     # Get events from session state
-    events = st.session_state.get("events", [])
+    events = st.session_state.get("events", ())
 
     if events:
         with live_placeholder.container():
             st.markdown("### 🔴 Live Updates")
 
-            for event in events[-5:]:  # Show last 5 live events
+            for event in list(events)[-5:]:  # Show last 5 live events
                 render_live_event(event)
 
 
@@ -259,15 +288,11 @@ def render_live_event(event: dict[str, Any]):
 
 def push_event(event_type: str, data: dict[str, Any] = None):
     """Push a new event to the session state for live display."""
-    if "events" not in st.session_state:
-        st.session_state.events = []
+    # The deque drops the oldest event once LIVE_EVENT_LIMIT is reached
+    events = st.session_state.setdefault("events", deque(maxlen=LIVE_EVENT_LIMIT))
 
-    st.session_state.events.append({
+    events.append({
         "type": event_type,
         "data": data or {},
         "timestamp": datetime.utcnow(),
     })
-
-    # Keep only last 100 events
-    if len(st.session_state.events) > 100:
-        st.session_state.events = st.session_state.events[-100:]
@@ -6,16 +6,55 @@ Displays run details, source ingestion controls, and agent controls.
 
 import asyncio
 import logging
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from uuid import UUID
 
 import streamlit as st
 
+from app.ui._cache import cached_source_count, cached_sources, clear_ingestion_caches
+from app.ui._loop import get_client, run_async
+from app.ui.progress import LIVE_EVENT_LIMIT
 from schemas.config import RunConfig
-from storage.supabase import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# PDFs ingested at once: one converting while another embeds
+_MAX_CONCURRENT_INGESTS = 2
+
+# Sources listed under "Add Sources"; the rest are only counted
+_SOURCE_LIST_LIMIT = 10
+
+# Badge color for each run status
+_STATUS_COLORS = {
+    "created": "blue",
+    "ingesting": "orange",
+    "researching": "orange",
+    "drafting": "orange",
+    "complete": "green",
+    "failed": "red",
+}
+
+
+def _load_chunker():
+    """Build the shared chunker (and its tokenizer), logging any failure."""
+    from ingestion.chunker import get_chunker
+
+    try:
+        get_chunker()
+    except Exception:
+        logger.exception("Chunker warm-up failed")
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_chunker() -> None:
+    """Start loading the chunker once per process, off the request path."""
+    threading.Thread(target=_load_chunker, name="chunker-warmup", daemon=True).start()
+
 
 def render_run_details():
     """Render the run details panel."""
@@ -23,30 +62,20 @@ def render_run_details():
         st.info("Select a run from the sidebar")
         return
 
+    # Ingestion is likely next; get the tokenizer loading in the background
+    _warm_chunker()
+
     run = st.session_state.current_run
 
     # Run header
     st.subheader(run.title)
 
-    # Status badge
-    status_colors = {
-        "created": "blue",
-        "ingesting": "orange",
-        "researching": "orange",
-        "drafting": "orange",
-        "complete": "green",
-        "failed": "red",
-    }
-    color = status_colors.get(run.status, "gray")
-    st.markdown(f"**Status:** :{color}[{run.status.upper()}]")
-
-    # Objective
-    st.markdown("**Objective:**")
-    st.markdown(f"> {run.objective}")
-
+    # Status badge, objective and constraints in a single element
+    color = _STATUS_COLORS.get(run.status, "gray")
+    details = f"**Status:** :{color}[{run.status.upper()}]\n\n**Objective:**\n> {run.objective}"
     if run.constraints:
-        st.markdown("**Constraints:**")
-        st.markdown(f"> {run.constraints}")
+        details += f"\n\n**Constraints:**\n> {run.constraints}"
+    st.markdown(details)
 
     st.markdown("---")
 
@@ -107,26 +136,56 @@ def ingest_pdfs(uploaded_files):
         status = st.empty()
 
         pipeline = PDFIngestionPipeline()
+        run_id = st.session_state.current_run_id
         total = len(uploaded_files)
 
-        for i, file in enumerate(uploaded_files):
-            status.text(f"Processing {file.name}...")
-
-            # Save to temp file
-            temp_path = Path(f"/tmp/{file.name}")
-            temp_path.write_bytes(file.read())
-
-            # Ingest
-            asyncio.run(pipeline.ingest(
-                pdf_path=temp_path,
-                run_id=st.session_state.current_run_id,
-                title=file.name,
-            ))
+        temp_paths = []
+        try:
+            # Stream each upload to a unique temp file in 1 MiB pieces, named
+            # after the upload since the source records the file's name
+            for file in uploaded_files:
+                with tempfile.NamedTemporaryFile(
+                    prefix=f"{Path(file.name).stem}-", suffix=".pdf", delete=False
+                ) as temp_file:
+                    shutil.copyfileobj(file, temp_file, length=1024 * 1024)
+                temp_paths.append(Path(temp_file.name))
+
+            # Ingest on worker threads, each with its own event loop, so the
+            # shared UI loop stays free for other sessions. Docling conversions
+            # take turns, so the next PDF converts while the previous one is
+            # being embedded
+            status.text(f"Processing {total} PDFs...")
+            with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_INGESTS) as pool:
+                futures = {
+                    pool.submit(asyncio.run, pipeline.ingest(
+                        file_path=temp_path,
+                        run_id=run_id,
+                        title=file.name,
+                    )): file.name
+                    for file, temp_path in zip(uploaded_files, temp_paths)
+                }
+
+                failed = 0
+                for done, future in enumerate(as_completed(futures), start=1):
+                    name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed += 1
+                        st.error(f"Failed to ingest {name}: {e}")
+                        logger.exception(f"PDF ingestion failed: {name}")
+
+                    progress.progress(done / total)
+        finally:
+            # Cleanup
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
 
-            progress.progress((i + 1) / total)
+        clear_ingestion_caches()
 
-            # Cleanup
-            temp_path.unlink()
+        if failed:
+            status.text(f"Ingested {total - failed} of {total} PDFs")
+            return
 
         status.text("✅ All PDFs ingested!")
         st.rerun()
@@ -149,17 +208,30 @@ def fetch_urls(urls: list[str]):
         status = st.empty()
 
         pipeline = URLIngestionPipeline()
+        run_id = st.session_state.current_run_id
         total = len(urls)
 
-        for i, url in enumerate(urls):
-            status.text(f"Fetching {url[:50]}...")
+        # Fetch concurrently through one crawler, on an event loop of this
+        # script run's own (not the shared UI loop); report each URL as it
+        # finishes
+        status.text(f"Fetching {total} URLs...")
+        done = failed = 0
+
+        def report(url: str, error: Exception | None):
+            nonlocal done, failed
+            done += 1
+            if error:
+                failed += 1
+                st.error(f"Failed to fetch {url[:50]}: {error}")
+            progress.progress(done / total)
 
-            asyncio.run(pipeline.ingest(
-                url=url,
-                run_id=st.session_state.current_run_id,
-            ))
+        asyncio.run(pipeline.ingest_multiple(urls, run_id, on_result=report))
 
-            progress.progress((i + 1) / total)
+        clear_ingestion_caches()
+
+        if failed:
+            status.text(f"Fetched {total - failed} of {total} URLs")
+            return
 
         status.text("✅ All URLs fetched!")
         st.rerun()
@@ -175,22 +247,22 @@ def render_source_list():
         return
 
     try:
-        client = get_supabase_client()
-        sources = asyncio.run(client.get_sources(st.session_state.current_run_id))
+        run_id = st.session_state.current_run_id
+        total = cached_source_count(run_id)
 
-        if not sources:
+        if not total:
             st.info("No sources ingested yet")
             return
 
-        st.markdown(f"**{len(sources)} sources ingested:**")
+        st.markdown(f"**{total} sources ingested:**")
 
-        for source in sources[:10]:
+        for source in cached_sources(run_id, limit=_SOURCE_LIST_LIMIT):
             icon = "📄" if source.type == "pdf" else "🌐"
             title = source.title[:40] + "..." if len(source.title) > 40 else source.title
             st.caption(f"{icon} {title}")
 
-        if len(sources) > 10:
-            st.caption(f"... and {len(sources) - 10} more")
+        if total > _SOURCE_LIST_LIMIT:
+            st.caption(f"... and {total - _SOURCE_LIST_LIMIT} more")
 
     except Exception as e:
         st.error(f"Failed to load sources: {e}")
@@ -207,9 +279,7 @@ def render_agent_controls():
 
     # Check if we have sources
     try:
-        client = get_supabase_client()
-        sources = asyncio.run(client.get_sources(run.id))
-        has_sources = len(sources) > 0
+        has_sources = cached_source_count(run.id) > 0
     except Exception:
         has_sources = False
 
@@ -244,7 +314,7 @@ def render_agent_controls():
 def start_agent():
     """Start the research agent."""
     st.session_state.agent_running = True
-    st.session_state.events = []
+    st.session_state.events = deque(maxlen=LIVE_EVENT_LIMIT)
 
     # The actual agent execution will be handled asynchronously
     # and updates will be pushed via session state
@@ -258,9 +328,11 @@ def refresh_run():
         return
 
     try:
-        client = get_supabase_client()
-        run = asyncio.run(client.get_run(st.session_state.current_run_id))
+        client = get_client()
+        run = run_async(client.get_run(st.session_state.current_run_id))
         st.session_state.current_run = run
+        # An explicit refresh should also bypass the cached source list
+        clear_ingestion_caches()
         st.rerun()
     except Exception as e:
         st.error(f"Failed to refresh: {e}")
@@ -1,17 +1,24 @@
 import os
 import uuid
+from contextlib import contextmanager
+from functools import cache
 from typing import Optional
 
 import boto3
-import psycopg2
 from fastapi import FastAPI, HTTPException
+from psycopg2.pool import ThreadedConnectionPool
 from pydantic import BaseModel
 
 from publish.publisher import publish_job
 
 
-def get_db_conn():
-    return psycopg2.connect(
+@cache
+def get_db_pool():
+    # Sync handlers run on FastAPI's threadpool (40 threads by default), so
+    # allow one connection per worker thread before getconn() raises
+    return ThreadedConnectionPool(
+        minconn=2,
+        maxconn=int(os.environ.get("POSTGRES_POOL_MAX", "40")),
         dbname=os.environ["POSTGRES_DB"],
         user=os.environ["POSTGRES_USER"],
         password=os.environ["POSTGRES_PASSWORD"],
@@ -20,6 +27,20 @@ def get_db_conn():
     )
 
 
+@contextmanager
+def get_db_conn():
+    # Borrow a pooled connection for one transaction (commit on success,
+    # rollback on error), then hand it back instead of closing it
+    pool = get_db_pool()
+    conn = pool.getconn()
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.putconn(conn)
+
+
+@cache
 def get_s3_client():
     return boto3.client(
         "s3",
@@ -67,15 +88,19 @@ def seed_job(req: SeedJobRequest):
 def lease_job():
     with get_db_conn() as conn:
         with conn.cursor() as cur:
+            # Claim the oldest queued job in one statement; SKIP LOCKED lets
+            # concurrent workers each take a different job instead of racing
             cur.execute(
-                "select id, slug, yt_url, source_key from jobs where status = %s order by created_at limit 1",
-                ("queued",),
+                "update jobs set status = %s where id = ("
+                "select id from jobs where status = %s order by created_at "
+                "for update skip locked limit 1"
+                ") returning id, slug, yt_url, source_key",
+                ("leased", "queued"),
             )
             row = cur.fetchone()
             if not row:
                 return {"job": None}
             job_id, slug, yt_url, source_key = row
-            cur.execute("update jobs set status = %s where id = %s", ("leased", job_id))
             return {
                 "job": {
                     "job_id": str(job_id),
@@ -7,11 +7,16 @@ This module provides:
 - Fallback chunking for edge cases
 """
 
+import asyncio
 import hashlib
 import logging
+import os
 import re
+import threading
+import time
+from functools import cached_property, lru_cache
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 from docling.chunking import HybridChunker
 from docling_core.types.doc import DoclingDocument
@@ -22,6 +27,25 @@ from schemas.models import Chunk, Source
 
 logger = logging.getLogger(__name__)
 
+# Markdown ATX heading: level marker and heading text
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+
+# Chunk texts whose hash and token count are remembered per chunker
+_MEASURE_CACHE_SIZE = 4096
+
+
+def _uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for chunk IDs.
+
+    The millisecond timestamp leads, so a document's chunks are inserted
+    near the end of the chunks primary key index instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
 
 class DoclingHybridChunker:
     """
@@ -42,31 +66,46 @@ class DoclingHybridChunker:
             config: Ingestion configuration
         """
         self.config = config or IngestionConfig()
-        self._tokenizer: Any | None = None
-        self._chunker: HybridChunker | None = None
+        # Re-ingesting a source yields the same chunk texts; skip re-measuring them
+        self._measure = lru_cache(maxsize=_MEASURE_CACHE_SIZE)(self._measure_uncached)
+        # The chunker is shared by the process, and its tokenizer isn't safe to
+        # use from several threads at once
+        self._lock = threading.Lock()
 
-    @property
+    @cached_property
     def tokenizer(self) -> Any:
         """Lazy initialization of tokenizer."""
-        if self._tokenizer is None:
-            model_id = "sentence-transformers/all-MiniLM-L6-v2"
-            logger.info(f"Initializing tokenizer: {model_id}")
-            self._tokenizer = AutoTokenizer.from_pretrained(model_id)
-        return self._tokenizer
+        model_id = "sentence-transformers/all-MiniLM-L6-v2"
+        logger.info(f"Initializing tokenizer: {model_id}")
+        return AutoTokenizer.from_pretrained(model_id, use_fast=True)
 
-    @property
+    @cached_property
     def chunker(self) -> HybridChunker:
         """Lazy initialization of HybridChunker."""
-        if self._chunker is None:
-            self._chunker = HybridChunker(
-                tokenizer=self.tokenizer,
-                max_tokens=self.config.chunk_size_tokens,
-                merge_peers=True,
-            )
-            logger.info(
-                f"HybridChunker initialized (max_tokens={self.config.chunk_size_tokens})"
-            )
-        return self._chunker
+        chunker = HybridChunker(
+            tokenizer=self.tokenizer,
+            max_tokens=self.config.chunk_size_tokens,
+            merge_peers=True,
+        )
+        logger.info(f"HybridChunker initialized (max_tokens={self.config.chunk_size_tokens})")
+        return chunker
+
+    def _token_counts(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for many lines or chunk texts in one batched tokenizer call.
+
+        Counts exclude special tokens, so the counts of consecutive lines can
+        be summed; add ``tokenizer.num_special_tokens_to_add()`` to match
+        ``len(tokenizer.encode(...))`` for a single sequence.
+        """
+        if not texts:
+            return []
+        encoded = self.tokenizer(texts, add_special_tokens=False, return_length=True)
+        return list(encoded["length"])
+
+    def _measure_uncached(self, content: str) -> tuple[str, int]:
+        """Content hash and token count of a chunk's text."""
+        return self._calculate_hash(content), len(self.tokenizer.encode(content))
 
     async def chunk_document(
         self,
@@ -85,13 +124,24 @@ class DoclingHybridChunker:
         Returns:
             List of Chunk models
         """
-        if docling_doc is not None:
-            return await self._chunk_with_docling(content, source, docling_doc)
-        else:
-            # Fall back to markdown chunking
-            return await self.chunk_markdown(content, source)
+        # Chunking and tokenizing are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self._chunk_locked, content, source, docling_doc)
 
-    async def _chunk_with_docling(
+    def _chunk_locked(
+        self,
+        content: str,
+        source: Source,
+        docling_doc: DoclingDocument | None = None,
+    ) -> list[Chunk]:
+        """Chunk a document while holding the chunker's lock (blocking)."""
+        with self._lock:
+            if docling_doc is not None:
+                return self._chunk_with_docling(content, source, docling_doc)
+            else:
+                # Fall back to markdown chunking
+                return self._chunk_markdown(content, source)
+
+    def _chunk_with_docling(
         self,
         content: str,
         source: Source,
@@ -112,11 +162,16 @@ class DoclingHybridChunker:
             chunk_iter = self.chunker.chunk(dl_doc=docling_doc)
             docling_chunks = list(chunk_iter)
 
+            # Get contextualized text (includes heading hierarchy) and count
+            # tokens for the whole document in one batched tokenizer call
+            texts = [self.chunker.contextualize(chunk=dc) for dc in docling_chunks]
+            special_tokens = self.tokenizer.num_special_tokens_to_add()
+            text_counts = self._token_counts(texts)
+
             chunks = []
-            for i, dc in enumerate(docling_chunks):
-                # Get contextualized text (includes heading hierarchy)
-                contextualized = self.chunker.contextualize(chunk=dc)
-                token_count = len(self.tokenizer.encode(contextualized))
+            for i, (dc, contextualized, count) in enumerate(
+                zip(docling_chunks, texts, text_counts)
+            ):
 
                 # Extract heading hierarchy if available
                 heading_hierarchy = self._extract_heading_hierarchy(dc)
@@ -125,7 +180,7 @@ class DoclingHybridChunker:
                 page_start, page_end = self._extract_page_info(dc)
 
                 chunk = Chunk(
-                    id=uuid4(),
+                    id=_uuid7(),
                     source_id=source.id,
                     run_id=source.run_id,
                     chunk_index=i,
@@ -135,7 +190,7 @@ class DoclingHybridChunker:
                     section_hint=heading_hierarchy[-1] if heading_hierarchy else None,
                     heading_hierarchy=heading_hierarchy,
                     content_hash=self._calculate_hash(contextualized),
-                    token_count=token_count,
+                    token_count=count + special_tokens,
                     chunk_method="docling_hybrid",
                     metadata={
                         "source_title": source.title,
@@ -149,12 +204,29 @@ class DoclingHybridChunker:
 
         except Exception as e:
             logger.warning(f"Docling chunking failed: {e}, falling back to markdown chunking")
-            return await self.chunk_markdown(content, source)
+            return self._chunk_markdown(content, source)
 
     async def chunk_markdown(
         self,
         content: str,
         source: Source,
+    ) -> list[Chunk]:
+        """
+        Smart markdown chunking that preserves structure, on a worker thread.
+
+        Args:
+            content: Markdown content
+            source: Source model
+
+        Returns:
+            List of Chunk models
+        """
+        return await asyncio.to_thread(self._chunk_locked, content, source)
+
+    def _chunk_markdown(
+        self,
+        content: str,
+        source: Source,
     ) -> list[Chunk]:
         """
         Smart markdown chunking that preserves structure.
@@ -175,172 +247,175 @@ class DoclingHybridChunker:
         if not content.strip():
             return []
 
+        max_tokens = self.config.chunk_size_tokens
         chunks = []
-        current_chunk = []
+        chunk_start = 0  # the chunk being built covers lines[chunk_start:i]
         current_tokens = 0
         current_heading = None
         heading_hierarchy: list[str] = []
 
         lines = content.split("\n")
+
+        # Offset of each line in content, plus one past the end, so a run of
+        # whole lines can be taken with a single slice instead of a join
+        line_offsets = [0]
+        for line in lines:
+            line_offsets.append(line_offsets[-1] + len(line) + 1)
+
+        # Tokenize every line in one batch; the per-sequence special tokens are
+        # added back so counts match encoding each line or code block alone
+        line_counts = self._token_counts(lines)
+        special_tokens = self.tokenizer.num_special_tokens_to_add()
         i = 0
 
         while i < len(lines):
             line = lines[i]
 
             # Check for code block
-            if line.strip().startswith("```"):
-                code_block, end_idx = self._extract_code_block(lines, i)
-                code_tokens = len(self.tokenizer.encode(code_block))
+            if line.lstrip().startswith("```"):
+                block_end = self._code_block_end(lines, i)
+                code_tokens = sum(line_counts[i:block_end]) + special_tokens
 
                 # If code block is too large, split it
-                if code_tokens > self.config.chunk_size_tokens:
+                if code_tokens > max_tokens:
                     # Save current chunk first
-                    if current_chunk:
+                    if chunk_start < i:
                         chunks.append(
                             self._create_chunk(
-                                current_chunk,
+                                content[line_offsets[chunk_start] : line_offsets[i] - 1],
                                 source,
                                 len(chunks),
-                                heading_hierarchy.copy(),
+                                heading_hierarchy,
                             )
                         )
-                        current_chunk = []
                         current_tokens = 0
 
-                    # Split large code block
-                    code_chunks = self._split_large_content(
-                        code_block, self.config.chunk_size_tokens
-                    )
-                    for cc in code_chunks:
-                        chunks.append(
-                            self._create_chunk(
-                                [cc], source, len(chunks), heading_hierarchy.copy()
+                    # Split large code block at line boundaries
+                    piece_start = i
+                    piece_tokens = 0
+                    for j in range(i, block_end):
+                        tokens = line_counts[j] + special_tokens
+                        if piece_tokens + tokens > max_tokens and piece_start < j:
+                            chunks.append(
+                                self._create_chunk(
+                                    content[line_offsets[piece_start] : line_offsets[j] - 1],
+                                    source,
+                                    len(chunks),
+                                    heading_hierarchy,
+                                )
                             )
+                            piece_start = j
+                            piece_tokens = 0
+                        piece_tokens += tokens
+
+                    chunks.append(
+                        self._create_chunk(
+                            content[line_offsets[piece_start] : line_offsets[block_end] - 1],
+                            source,
+                            len(chunks),
+                            heading_hierarchy,
                         )
+                    )
+                    chunk_start = block_end
                 else:
                     # Check if code block fits in current chunk
-                    if current_tokens + code_tokens > self.config.chunk_size_tokens:
-                        if current_chunk:
+                    if current_tokens + code_tokens > max_tokens:
+                        if chunk_start < i:
                             chunks.append(
                                 self._create_chunk(
-                                    current_chunk,
+                                    content[line_offsets[chunk_start] : line_offsets[i] - 1],
                                     source,
                                     len(chunks),
-                                    heading_hierarchy.copy(),
+                                    heading_hierarchy,
                                 )
                             )
-                            current_chunk = []
+                            chunk_start = i
                             current_tokens = 0
 
-                    current_chunk.append(code_block)
                     current_tokens += code_tokens
 
-                i = end_idx + 1
+                i = block_end
                 continue
 
             # Check for heading
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+            heading_match = _HEADING_RE.match(line)
             if heading_match:
                 level = len(heading_match.group(1))
                 heading_text = heading_match.group(2).strip()
 
-                # Update heading hierarchy
+                # Update heading hierarchy; slicing makes a new list, so the
+                # one handed to earlier chunks is never mutated (and Chunk
+                # validation copies it regardless)
                 heading_hierarchy = heading_hierarchy[: level - 1]
                 heading_hierarchy.append(heading_text)
                 current_heading = heading_text
 
             # Calculate line tokens
-            line_tokens = len(self.tokenizer.encode(line))
+            line_tokens = line_counts[i] + special_tokens
 
             # Check if we need to start a new chunk
-            if current_tokens + line_tokens > self.config.chunk_size_tokens:
-                if current_chunk:
+            if current_tokens + line_tokens > max_tokens:
+                if chunk_start < i:
                     chunks.append(
                         self._create_chunk(
-                            current_chunk,
+                            content[line_offsets[chunk_start] : line_offsets[i] - 1],
                             source,
                             len(chunks),
-                            heading_hierarchy.copy(),
+                            heading_hierarchy,
                         )
                     )
-                    current_chunk = []
+                    chunk_start = i
                     current_tokens = 0
 
-            current_chunk.append(line)
             current_tokens += line_tokens
             i += 1
 
         # Don't forget the last chunk
-        if current_chunk:
+        if chunk_start < i:
             chunks.append(
                 self._create_chunk(
-                    current_chunk, source, len(chunks), heading_hierarchy.copy()
+                    content[line_offsets[chunk_start] : line_offsets[i] - 1],
+                    source,
+                    len(chunks),
+                    heading_hierarchy,
                 )
             )
 
         logger.info(f"Created {len(chunks)} chunks using smart markdown chunking")
         return chunks
 
-    def _extract_code_block(
-        self, lines: list[str], start_idx: int
-    ) -> tuple[str, int]:
-        """Extract a complete code block from lines."""
-        block_lines = [lines[start_idx]]
-        i = start_idx + 1
-
-        while i < len(lines):
-            block_lines.append(lines[i])
-            if lines[i].strip().startswith("```"):
-                break
-            i += 1
-
-        return "\n".join(block_lines), i
-
-    def _split_large_content(
-        self, content: str, max_tokens: int
-    ) -> list[str]:
-        """Split large content into smaller chunks."""
-        chunks = []
-        lines = content.split("\n")
-        current_chunk = []
-        current_tokens = 0
-
-        for line in lines:
-            line_tokens = len(self.tokenizer.encode(line))
-
-            if current_tokens + line_tokens > max_tokens and current_chunk:
-                chunks.append("\n".join(current_chunk))
-                current_chunk = []
-                current_tokens = 0
-
-            current_chunk.append(line)
-            current_tokens += line_tokens
-
-        if current_chunk:
-            chunks.append("\n".join(current_chunk))
+    def _code_block_end(self, lines: list[str], start_idx: int) -> int:
+        """
+        Find where a code block opened at ``start_idx`` ends.
 
-        return chunks
+        Returns the index just past the closing fence; an unterminated block
+        runs to the end of ``lines``.
+        """
+        for i in range(start_idx + 1, len(lines)):
+            if lines[i].lstrip().startswith("```"):
+                return i + 1
+        return len(lines)
 
     def _create_chunk(
         self,
-        lines: list[str],
+        text: str,
         source: Source,
         index: int,
         heading_hierarchy: list[str],
     ) -> Chunk:
-        """Create a Chunk model from lines."""
-        content = "\n".join(lines).strip()
-        token_count = len(self.tokenizer.encode(content))
+        """Create a Chunk model from a run of markdown lines."""
+        content = text.strip()
+        content_hash, token_count = self._measure(content)
 
         return Chunk(
-            id=uuid4(),
+            id=_uuid7(),
             source_id=source.id,
             run_id=source.run_id,
             chunk_index=index,
             content=content,
             section_hint=heading_hierarchy[-1] if heading_hierarchy else None,
             heading_hierarchy=heading_hierarchy,
-            content_hash=self._calculate_hash(content),
+            content_hash=content_hash,
             token_count=token_count,
             chunk_method="smart_markdown",
             metadata={
@@ -369,17 +444,27 @@ class DoclingHybridChunker:
         return None, None
 
     def _calculate_hash(self, content: str) -> str:
-        """Calculate SHA-256 hash of content."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        """Calculate SHA-256 hash of content (for deduplication, not security)."""
+        return hashlib.sha256(content.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 # Singleton instance
 _chunker: DoclingHybridChunker | None = None
+_chunker_lock = threading.Lock()
 
 
 def get_chunker(config: IngestionConfig | None = None) -> DoclingHybridChunker:
-    """Get or create the chunker singleton."""
+    """
+    Get or create the chunker singleton.
+
+    Creation is locked so concurrent sessions share one instance, and the
+    tokenizer is loaded up front rather than on the first chunking call.
+    """
     global _chunker
     if _chunker is None:
-        _chunker = DoclingHybridChunker(config)
+        with _chunker_lock:
+            if _chunker is None:
+                chunker = DoclingHybridChunker(config)
+                chunker.tokenizer  # noqa: B018 - force the tokenizer load
+                _chunker = chunker
     return _chunker
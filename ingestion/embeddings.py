@@ -8,18 +8,149 @@ This module provides:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from array import array
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cached_property
 from typing import Any
 
 import openai
+import tiktoken
 
 from schemas.config import IngestionConfig, get_settings
 from schemas.models import Chunk
 
 logger = logging.getLogger(__name__)
 
+# Per-request limits for packing embedding inputs: the API accepts up to 2048
+# inputs and 300k tokens per request; stay well under the token ceiling
+_MAX_BATCH_INPUTS = 2048
+_MAX_BATCH_TOKENS = 100_000
+
+# Retries for OpenAI calls; the SDK backs off exponentially with jitter and
+# honors the Retry-After header on 429s
+_MAX_API_RETRIES = 4
+
+# Upper bound for the adaptive window on context-generation requests
+_MAX_CONTEXT_REQUESTS = 64
+
+# Times a request still rate limited after the client's own retries is sent
+# again, once the adaptive window has shrunk, before giving up on it
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Instructions for context generation. They lead the system message, followed
+# by the document, so every request for one document shares a long identical
+# prefix that OpenAI's automatic prompt caching can reuse
+_CONTEXT_INSTRUCTIONS = (
+    "You are a helpful assistant that provides concise contextual information. "
+    "You will be given a document, then one or more chunks from it. For each "
+    "chunk, please give a short succinct context (1-2 sentences) to situate it "
+    "within the overall document for the purposes of improving search retrieval "
+    "of the chunk. Answer only with the succinct context and nothing else, in "
+    "the format requested."
+)
+
+# Tokens of the document sent with each context-generation request
+_CONTEXT_DOCUMENT_TOKENS = 50_000
+
+# Chunks situated per context-generation request. Each request repeats the
+# whole document, so grouping chunks cuts input tokens roughly by this factor
+_CONTEXT_GROUP_SIZE = 10
+
+# Appended to a grouped request: the chunks are numbered and the model answers
+# with one context per chunk, in order, as a JSON object
+_CONTEXT_GROUP_FORMAT = (
+    'Respond with a JSON object {"contexts": [...]} holding one context string '
+    "per chunk, in the order the chunks are given."
+)
+
+# Embeddings remembered per process; at 1536 dims each entry is ~12 KB
+_EMBEDDING_CACHE_SIZE = 4096
+
+
+class _EmbeddingCache:
+    """
+    Process-wide LRU of embeddings keyed by a hash of (model, text).
+
+    Vectors are kept as compact float arrays rather than lists of Python
+    floats; the lock makes it safe to share between event loop threads.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, array] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """Cache key for a text embedded with a model."""
+        return hashlib.sha256(f"{model}\0{text}".encode(), usedforsecurity=False).digest()
+
+    def get_many(self, keys: list[bytes]) -> list[list[float] | None]:
+        """Cached embeddings for the keys, None where missing."""
+        with self._lock:
+            found = []
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                found.append(vector)
+        return [None if vector is None else vector.tolist() for vector in found]
+
+    def put_many(self, keys: list[bytes], embeddings: list[list[float]]) -> None:
+        """Remember embeddings, evicting the least recently used past maxsize."""
+        vectors = [array("d", embedding) for embedding in embeddings]
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_embedding_cache = _EmbeddingCache(_EMBEDDING_CACHE_SIZE)
+
+
+class _AdaptiveLimiter:
+    """
+    AIMD concurrency window for OpenAI calls made from one event loop.
+
+    The window grows by about one request per window of successful calls and
+    halves when a call is still rate limited after the client's own retries,
+    so concurrency settles just under what the account's limits allow.
+    """
+
+    def __init__(self, initial: int, maximum: int):
+        self.maximum = maximum
+        self.window = float(max(1, min(initial, maximum)))
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < int(self.window))
+            self._in_flight += 1
+        try:
+            yield
+        except openai.RateLimitError:
+            self.window = max(1.0, self.window / 2)
+            logger.warning(f"Rate limited, concurrency window now {int(self.window)}")
+            raise
+        else:
+            self.window = min(float(self.maximum), self.window + 1 / self.window)
+        finally:
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
 
 class EmbeddingClient:
     """
@@ -28,7 +159,7 @@ class EmbeddingClient:
     Supports:
     - OpenAI embeddings (text-embedding-3-small, etc.)
     - Batch processing for efficiency
-    - Exponential backoff on rate limits
+    - Backoff on rate limits that follows the server's Retry-After
     """
 
     def __init__(
@@ -47,57 +178,158 @@ class EmbeddingClient:
         settings = get_settings()
         self.api_key = api_key or settings.openai_api_key
 
-        if self.api_key:
-            openai.api_key = self.api_key
+    @cached_property
+    def client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client, created on first use (it requires an API key)."""
+        return openai.AsyncOpenAI(api_key=self.api_key, max_retries=_MAX_API_RETRIES)
+
+    @cached_property
+    def encoding(self) -> tiktoken.Encoding | None:
+        """Tokenizer for the embedding model, or None to estimate counts."""
+        try:
+            return tiktoken.encoding_for_model(self.model)
+        except Exception as e:
+            logger.warning(f"No tiktoken encoding for {self.model} ({e}), estimating tokens")
+            return None
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """Token count of each text (a conservative estimate without an encoding)."""
+        if self.encoding is None:
+            return [len(text) // 3 + 1 for text in texts]
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
 
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """
         Create embeddings for multiple texts.
 
+        Texts already embedded with this model in this process are served
+        from an in-memory cache; only the rest are sent to the API.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors (zero vectors where the request failed)
         """
+        embeddings = await self._embed(texts)
+        failed = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if failed:
+            fallback = self._fallback_embeddings([texts[i] for i in failed])
+            for i, embedding in zip(failed, fallback):
+                embeddings[i] = embedding
+        return embeddings
+
+    async def _embed(self, texts: list[str]) -> list[list[float] | None]:
+        """Embed texts through the cache, with None where the request failed."""
         if not texts:
             return []
 
-        max_retries = 3
-        retry_delay = 1.0
+        keys = [_EmbeddingCache.key(self.model, text) for text in texts]
+        embeddings = _embedding_cache.get_many(keys)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not missing:
+            return embeddings
 
-        for retry in range(max_retries):
-            try:
-                response = openai.embeddings.create(
-                    model=self.model,
-                    input=texts,
-                )
-                return [item.embedding for item in response.data]
-
-            except openai.RateLimitError as e:
-                if retry < max_retries - 1:
-                    logger.warning(
-                        f"Rate limited (attempt {retry + 1}/{max_retries}), "
-                        f"retrying in {retry_delay}s..."
-                    )
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise
+        fresh = await self._create_embeddings([texts[i] for i in missing])
+        if fresh is None:
+            # Failures are left as None and never cached
+            return embeddings
+        _embedding_cache.put_many([keys[i] for i in missing], fresh)
 
-            except Exception as e:
-                if retry < max_retries - 1:
-                    logger.warning(
-                        f"Embedding error (attempt {retry + 1}/{max_retries}): {e}"
-                    )
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    logger.error(f"Failed to create embeddings after {max_retries} attempts: {e}")
-                    # Return zero embeddings as fallback
-                    return self._fallback_embeddings(texts)
+        for i, embedding in zip(missing, fresh):
+            embeddings[i] = embedding
+        return embeddings
+
+    async def _create_embeddings(self, texts: list[str]) -> list[list[float]] | None:
+        """
+        Request embeddings from the API.
 
-        return self._fallback_embeddings(texts)
+        Rate limits, timeouts, connection errors and 5xx responses are retried
+        by the client itself (see ``_MAX_API_RETRIES``).
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors, or None if the request failed
+
+        Raises:
+            openai.RateLimitError: If still rate limited after all retries
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=texts,
+            )
+            return [item.embedding for item in response.data]
+
+        except openai.RateLimitError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Failed to create embeddings: {e}")
+            return None
+
+    async def embed_batched(
+        self,
+        texts: list[str],
+        batch_size: int = _MAX_BATCH_INPUTS,
+        max_concurrent: int = 8,
+        max_batch_tokens: int = _MAX_BATCH_TOKENS,
+    ) -> list[list[float] | None]:
+        """
+        Create embeddings in token-packed batches, several in flight at once.
+
+        Consecutive texts are packed into one request until it would exceed
+        ``max_batch_tokens`` tokens or ``batch_size`` texts, so requests are
+        sized by the work they carry rather than by a fixed text count.
+
+        Args:
+            texts: List of texts to embed
+            batch_size: Maximum texts per embedding request
+            max_concurrent: Maximum number of requests in flight; the window
+                starts at half of this, grows toward it while requests succeed
+                and halves when they stay rate limited
+            max_batch_tokens: Maximum tokens per embedding request
+
+        Returns:
+            List of embedding vectors, in the order of ``texts``, with None
+            for texts whose request failed (no zero-vector stand-ins)
+        """
+        # Repeated texts (page headers, footers) are embedded once
+        unique = list(dict.fromkeys(texts))
+
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text, tokens in zip(unique, self.count_tokens(unique)):
+            if batch and (
+                batch_tokens + tokens > max_batch_tokens or len(batch) >= batch_size
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+
+        limiter = _AdaptiveLimiter(initial=max_concurrent // 2, maximum=max_concurrent)
+
+        async def embed_batch(batch: list[str]) -> list[list[float] | None]:
+            for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+                try:
+                    async with limiter.slot():
+                        return await self._embed(batch)
+                except openai.RateLimitError as e:
+                    # The slot has halved the window; retry under it
+                    if attempt == _MAX_RATE_LIMIT_RETRIES:
+                        logger.error(f"Failed to create embeddings: {e}")
+            return [None] * len(batch)
+
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        embeddings = dict(zip(unique, (embedding for batch in results for embedding in batch)))
+        return [embeddings[text] for text in texts]
 
     async def embed_single(self, text: str) -> list[float]:
         """
@@ -118,6 +350,11 @@ class EmbeddingClient:
         return [[0.0] * 1536 for _ in texts]
 
 
+def _context_system_prompt(document: str) -> str:
+    """System message for context generation; identical across a document's requests."""
+    return f"{_CONTEXT_INSTRUCTIONS}\n\n<document>\n{document}\n</document>"
+
+
 class ContextualEmbedder:
     """
     Contextual embedding generator that enhances chunks with document context.
@@ -143,6 +380,33 @@ class ContextualEmbedder:
         settings = get_settings()
         self.context_model = settings.contextualizer_model or "gpt-4o-mini"
 
+    @cached_property
+    def client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client for context generation, created on first use."""
+        return openai.AsyncOpenAI(
+            api_key=self.embedding_client.api_key, max_retries=_MAX_API_RETRIES
+        )
+
+    @cached_property
+    def encoding(self) -> tiktoken.Encoding | None:
+        """Tokenizer for the context model, or None to truncate by characters."""
+        model = self.context_model.split(":")[-1]
+        try:
+            return tiktoken.encoding_for_model(model)
+        except Exception as e:
+            logger.warning(f"No tiktoken encoding for {model} ({e}), truncating by characters")
+            return None
+
+    def _truncate_document(self, document: str) -> str:
+        """Cut the document to the context budget of ``_CONTEXT_DOCUMENT_TOKENS``."""
+        # A token covers at least one byte, so a document this short already fits
+        if len(document.encode()) <= _CONTEXT_DOCUMENT_TOKENS:
+            return document
+        if self.encoding is None:
+            return document[:25000]
+        tokens = self.encoding.encode_ordinary(document)
+        return self.encoding.decode(tokens[:_CONTEXT_DOCUMENT_TOKENS])
+
     async def embed_chunks(
         self,
         chunks: list[Chunk],
@@ -155,7 +419,8 @@ class ContextualEmbedder:
         Args:
             chunks: List of chunks to embed
             full_document: Full document text for context generation
-            batch_size: Batch size for parallel processing
+            batch_size: Initial concurrent context requests (embedding
+                requests are packed by token count)
 
         Returns:
             Chunks with embeddings populated
@@ -169,20 +434,17 @@ class ContextualEmbedder:
                 chunks, full_document, batch_size
             )
 
-        # Generate embeddings in batches
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-
-            # Use full content (with contextual prefix if available)
-            texts = [chunk.full_content for chunk in batch]
+        # Generate embeddings in concurrent batches, using full content
+        # (with contextual prefix if available)
+        embeddings = await self.embedding_client.embed_batched(
+            [chunk.full_content for chunk in chunks],
+            max_concurrent=self.config.max_concurrent_embedding_batches,
+        )
 
-            embeddings = await self.embedding_client.embed(texts)
-
-            for chunk, embedding in zip(batch, embeddings):
-                chunk.embedding = embedding
-
-            logger.debug(f"Embedded batch {i // batch_size + 1}")
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk.embedding = embedding
 
+        _warn_unembedded(chunks)
         logger.info(f"Generated embeddings for {len(chunks)} chunks")
         return chunks
 
@@ -198,70 +460,98 @@ class ContextualEmbedder:
         Args:
             chunks: Chunks to enhance
             full_document: Full document for context
-            batch_size: Batch size for parallel processing
+            batch_size: Context requests in flight to start with
 
         Returns:
             Chunks with contextual_prefix populated
         """
         logger.info(f"Generating contextual prefixes for {len(chunks)} chunks...")
 
-        # Truncate document for context (avoid token limits)
-        doc_context = full_document[:25000]
+        # Truncate document for context (avoid token limits), once per document
+        doc_context = self._truncate_document(full_document)
+
+        # Built once; every request for this document sends it unchanged
+        system = _context_system_prompt(doc_context)
 
-        # Process in parallel batches
-        with ThreadPoolExecutor(max_workers=batch_size) as executor:
-            loop = asyncio.get_event_loop()
+        # Process groups of chunks concurrently, starting at batch_size
+        # requests in flight and adapting the window to rate limits
+        limiter = _AdaptiveLimiter(initial=batch_size, maximum=_MAX_CONTEXT_REQUESTS)
+
+        async def process_chunk(chunk: Chunk) -> None:
+            try:
+                async with limiter.slot():
+                    prefix = await self._generate_context(system, chunk.content)
+                chunk.contextual_prefix = prefix
+            except Exception as e:
+                logger.warning(f"Failed to generate context for chunk {chunk.chunk_index}: {e}")
 
-            async def process_chunk(chunk: Chunk) -> Chunk:
+        async def process_group(group: list[Chunk]) -> None:
+            contents = [chunk.content for chunk in group]
+            for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
                 try:
-                    prefix = await self._generate_context(doc_context, chunk.content)
-                    chunk.contextual_prefix = prefix
+                    async with limiter.slot():
+                        contexts = await self._generate_context_group(system, contents)
+                    break
+                except openai.RateLimitError as e:
+                    # The slot has halved the window; retry the group under it
+                    if attempt == _MAX_RATE_LIMIT_RETRIES:
+                        logger.warning(f"Grouped context generation failed: {e}")
+                        return
                 except Exception as e:
-                    logger.warning(f"Failed to generate context for chunk {chunk.chunk_index}: {e}")
-                return chunk
+                    # Per-chunk requests would each resend the whole document
+                    # to an API that is already failing, so leave these be
+                    logger.warning(f"Grouped context generation failed: {e}")
+                    return
+
+            # Chunks the grouped answer didn't cover get a request of their own
+            missing = []
+            for chunk, context in zip(group, contexts):
+                if context:
+                    chunk.contextual_prefix = context
+                else:
+                    missing.append(chunk)
+            await asyncio.gather(*(process_chunk(chunk) for chunk in missing))
+
+        groups = [
+            chunks[i:i + _CONTEXT_GROUP_SIZE]
+            for i in range(0, len(chunks), _CONTEXT_GROUP_SIZE)
+        ]
 
-            tasks = [process_chunk(chunk) for chunk in chunks]
-            chunks = await asyncio.gather(*tasks)
+        # The first request writes the shared document prefix to the prompt
+        # cache; the rest then fan out and read it instead of all missing
+        await process_group(groups[0])
+        await asyncio.gather(*(process_group(group) for group in groups[1:]))
 
         context_count = sum(1 for c in chunks if c.contextual_prefix)
         logger.info(f"Generated {context_count}/{len(chunks)} contextual prefixes")
 
-        return list(chunks)
+        return chunks
 
     async def _generate_context(
         self,
-        document: str,
+        system: str,
         chunk: str,
     ) -> str | None:
         """
         Generate contextual prefix for a chunk.
 
         Args:
-            document: Document context
+            system: System message from ``_context_system_prompt``
             chunk: Chunk content
 
         Returns:
             Contextual prefix or None if generation fails
         """
-        prompt = f"""<document>
-{document}
-</document>
-
-Here is the chunk we want to situate within the whole document:
+        prompt = f"""Here is the chunk we want to situate within the whole document:
 <chunk>
 {chunk}
-</chunk>
-
-Please give a short succinct context (1-2 sentences) to situate this chunk within the overall document for the purposes of improving search retrieval of the chunk. Answer only with the succinct context and nothing else."""
+</chunk>"""
 
         try:
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.context_model.split(":")[-1] if ":" in self.context_model else self.context_model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that provides concise contextual information.",
-                    },
+                    {"role": "system", "content": system},
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.3,
@@ -270,10 +560,66 @@ Please give a short succinct context (1-2 sentences) to situate this chunk withi
 
             return response.choices[0].message.content.strip()
 
+        except openai.RateLimitError:
+            # Surfaced so the caller's concurrency window can back off
+            raise
+
         except Exception as e:
             logger.warning(f"Context generation failed: {e}")
             return None
 
+    async def _generate_context_group(
+        self,
+        system: str,
+        chunks: list[str],
+    ) -> list[str | None]:
+        """
+        Generate contextual prefixes for several chunks in one request.
+
+        Args:
+            system: System message from ``_context_system_prompt``
+            chunks: Chunk contents
+
+        Returns:
+            One prefix per chunk, None where the response didn't provide one
+
+        Raises:
+            openai.APIError: If the request itself fails
+        """
+        numbered = "\n".join(
+            f'<chunk index="{i}">\n{chunk}\n</chunk>' for i, chunk in enumerate(chunks, 1)
+        )
+        prompt = f"""Here are the chunks we want to situate within the whole document:
+{numbered}
+
+{_CONTEXT_GROUP_FORMAT}"""
+
+        response = await self.client.chat.completions.create(
+            model=self.context_model.split(":")[-1] if ":" in self.context_model else self.context_model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            max_tokens=200 * len(chunks),
+        )
+
+        try:
+            contexts = json.loads(response.choices[0].message.content)["contexts"]
+        except (TypeError, KeyError, ValueError) as e:
+            logger.warning(f"Couldn't parse grouped contexts: {e}")
+            return [None] * len(chunks)
+
+        if not isinstance(contexts, list) or len(contexts) != len(chunks):
+            logger.warning(f"Grouped context generation didn't return {len(chunks)} contexts")
+            return [None] * len(chunks)
+
+        return [
+            context.strip() if isinstance(context, str) and context.strip() else None
+            for context in contexts
+        ]
+
 
 class SimpleEmbedder:
     """
@@ -296,7 +642,7 @@ class SimpleEmbedder:
         self,
         chunks: list[Chunk],
         full_document: str | None = None,  # Ignored
-        batch_size: int = 20,
+        batch_size: int = _MAX_BATCH_INPUTS,
     ) -> list[Chunk]:
         """
         Generate embeddings for chunks without contextual enhancement.
@@ -304,7 +650,8 @@ class SimpleEmbedder:
         Args:
             chunks: List of chunks to embed
             full_document: Ignored (for API compatibility)
-            batch_size: Batch size for embedding
+            batch_size: Maximum chunks per embedding request (requests are
+                also capped by token count)
 
         Returns:
             Chunks with embeddings populated
@@ -312,19 +659,33 @@ class SimpleEmbedder:
         if not chunks:
             return chunks
 
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            texts = [chunk.content for chunk in batch]
-
-            embeddings = await self.embedding_client.embed(texts)
+        embeddings = await self.embedding_client.embed_batched(
+            [chunk.content for chunk in chunks],
+            batch_size=batch_size,
+            max_concurrent=self.config.max_concurrent_embedding_batches,
+        )
 
-            for chunk, embedding in zip(batch, embeddings):
-                chunk.embedding = embedding
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk.embedding = embedding
 
+        _warn_unembedded(chunks)
         logger.info(f"Generated embeddings for {len(chunks)} chunks (simple mode)")
         return chunks
 
 
+def _warn_unembedded(chunks: list[Chunk]) -> None:
+    """
+    Log chunks left without an embedding after a failed request.
+
+    They are stored with a NULL embedding rather than a zero vector: keyword
+    search still finds them, vector search skips them instead of ranking
+    noise, and ``embedding IS NULL`` picks them out for re-embedding.
+    """
+    missing = sum(1 for chunk in chunks if chunk.embedding is None)
+    if missing:
+        logger.warning(f"{missing}/{len(chunks)} chunks left without embeddings")
+
+
 # Factory function
 def get_embedder(config: IngestionConfig | None = None) -> ContextualEmbedder | SimpleEmbedder:
     """
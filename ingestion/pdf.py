@@ -7,8 +7,11 @@ This module provides PDF extraction with:
 - Metadata extraction (page numbers, heading hierarchy)
 """
 
+import asyncio
 import hashlib
+import io
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
@@ -21,6 +24,33 @@ from schemas.models import Chunk, Source
 
 logger = logging.getLogger(__name__)
 
+# Docling loads its layout and table models when a converter is built, so one
+# converter is shared by every extractor in the process
+_converter: DocumentConverter | None = None
+_converter_lock = threading.Lock()
+
+
+def _get_converter() -> DocumentConverter:
+    """Get or create the shared document converter."""
+    global _converter
+    if _converter is None:
+        with _converter_lock:
+            if _converter is None:
+                logger.info("Initializing Docling DocumentConverter...")
+                _converter = DocumentConverter()
+    return _converter
+
+
+# Conversions share the converter, so they take turns
+_convert_lock = threading.Lock()
+
+
+def _convert_to_markdown(file_path: Path) -> tuple[DoclingDocument, str]:
+    """Convert a PDF with Docling and export it to markdown (blocking, CPU-bound)."""
+    with _convert_lock:
+        docling_doc = _get_converter().convert(str(file_path)).document
+    return docling_doc, docling_doc.export_to_markdown()
+
 
 class PDFExtractor:
     """
@@ -41,15 +71,11 @@ class PDFExtractor:
             config: Ingestion configuration (optional)
         """
         self.config = config or IngestionConfig()
-        self._converter: DocumentConverter | None = None
 
     @property
     def converter(self) -> DocumentConverter:
-        """Lazy initialization of the document converter."""
-        if self._converter is None:
-            logger.info("Initializing Docling DocumentConverter...")
-            self._converter = DocumentConverter()
-        return self._converter
+        """The process-wide document converter, created on first use."""
+        return _get_converter()
 
     async def extract(
         self,
@@ -83,19 +109,18 @@ class PDFExtractor:
         logger.info(f"Extracting PDF: {file_path.name}")
 
         try:
-            # Convert PDF with Docling
-            result = self.converter.convert(str(file_path))
-            docling_doc = result.document
-
-            # Export to markdown for text processing
-            markdown = docling_doc.export_to_markdown()
+            # Convert PDF with Docling and export to markdown for text
+            # processing, while hashing the PDF itself (so the hash doesn't
+            # depend on extraction); both on worker threads so the event loop
+            # stays free
+            (docling_doc, markdown), content_hash = await asyncio.gather(
+                asyncio.to_thread(_convert_to_markdown, file_path),
+                asyncio.to_thread(self._calculate_hash, file_path),
+            )
 
             # Extract title from document or filename
             extracted_title = title or self._extract_title(docling_doc, file_path)
 
-            # Calculate content hash
-            content_hash = self._calculate_hash(markdown)
-
             # Create Source model
             source = Source(
                 id=uuid4(),
@@ -148,16 +173,21 @@ class PDFExtractor:
             import pypdf
 
             reader = pypdf.PdfReader(str(file_path))
-            pages_text = []
 
+            # Write pages straight into one buffer rather than a list of
+            # per-page strings joined at the end
+            buffer = io.StringIO()
             for i, page in enumerate(reader.pages):
                 text = page.extract_text()
                 if text:
-                    pages_text.append(f"## Page {i + 1}\n\n{text}")
+                    if buffer.tell():
+                        buffer.write("\n\n")
+                    buffer.write(f"## Page {i + 1}\n\n")
+                    buffer.write(text)
 
-            markdown = "\n\n".join(pages_text)
+            markdown = buffer.getvalue()
             extracted_title = title or file_path.stem
-            content_hash = self._calculate_hash(markdown)
+            content_hash = self._calculate_hash(file_path)
 
             source = Source(
                 id=uuid4(),
@@ -199,9 +229,12 @@ class PDFExtractor:
             pass
         return None
 
-    def _calculate_hash(self, content: str) -> str:
-        """Calculate SHA-256 hash of content."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def _calculate_hash(self, file_path: Path) -> str:
+        """Calculate SHA-256 hash of the PDF file (for deduplication, not security)."""
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(
+                f, lambda: hashlib.sha256(usedforsecurity=False)
+            ).hexdigest()
 
 
 class PDFIngestionPipeline:
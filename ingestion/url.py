@@ -8,11 +8,13 @@ This module provides web content extraction with:
 - Smart content detection
 """
 
+import asyncio
 import hashlib
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 from uuid import UUID, uuid4
 
 from crawl4ai import AsyncWebCrawler
@@ -22,6 +24,9 @@ from schemas.models import Chunk, Source
 
 logger = logging.getLogger(__name__)
 
+# Characters of page content encoded at a time while hashing
+_HASH_SLICE_CHARS = 1 << 20
+
 
 class URLFetcher:
     """
@@ -48,6 +53,7 @@ class URLFetcher:
         url: str,
         run_id: UUID,
         title: str | None = None,
+        crawler: AsyncWebCrawler | None = None,
     ) -> tuple[Source, str, str | None]:
         """
         Fetch content from a URL.
@@ -56,6 +62,8 @@ class URLFetcher:
             url: URL to fetch
             run_id: ID of the research run
             title: Optional title override
+            crawler: Running crawler to reuse (one is started for this URL
+                if not given)
 
         Returns:
             Tuple of (Source model, markdown content, HTML snapshot or None)
@@ -63,53 +71,16 @@ class URLFetcher:
         Raises:
             ValueError: If URL is invalid or fetch fails
         """
-        # Validate URL
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            raise ValueError(f"Invalid URL: {url}")
-
-        logger.info(f"Fetching URL: {url}")
+        # Validate before starting a crawler
+        self._parse_url(url)
 
         try:
+            if crawler is not None:
+                return await self._fetch_one(crawler, url, run_id, title)
             async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url=url)
-
-                if not result.success:
-                    raise ValueError(f"Failed to fetch URL: {result.error_message}")
-
-                markdown = result.markdown or ""
-                html_snapshot = result.html if self.config.store_html_snapshots else None
-
-                # Extract or generate title
-                extracted_title = title or result.title or self._title_from_url(url)
-
-                # Calculate content hash
-                content_hash = self._calculate_hash(markdown)
-
-                # Create Source model
-                source = Source(
-                    id=uuid4(),
-                    run_id=run_id,
-                    type="url",
-                    title=extracted_title,
-                    uri=url,
-                    content_hash=content_hash,
-                    metadata={
-                        "domain": parsed.netloc,
-                        "path": parsed.path,
-                        "captured_at": datetime.utcnow().isoformat(),
-                        "content_length": len(markdown),
-                        "has_html_snapshot": html_snapshot is not None,
-                    },
-                )
-
-                logger.info(
-                    f"Fetched URL: {extracted_title} "
-                    f"({len(markdown)} chars from {parsed.netloc})"
-                )
-
-                return source, markdown, html_snapshot
-
+                return await self._fetch_one(crawler, url, run_id, title)
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch URL {url}: {e}")
             raise ValueError(f"Could not fetch URL content: {e}")
@@ -122,6 +93,9 @@ class URLFetcher:
         """
         Fetch content from multiple URLs concurrently.
 
+        All URLs share one crawler, so the browser starts once rather than
+        once per URL.
+
         Args:
             urls: List of URLs to fetch
             run_id: ID of the research run
@@ -129,27 +103,35 @@ class URLFetcher:
         Returns:
             List of (Source, markdown, HTML snapshot) tuples
         """
-        import asyncio
-
-        results = []
-        errors = []
-
         # Process URLs concurrently with a semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(5)  # Max 5 concurrent fetches
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_fetches)
 
-        async def fetch_with_semaphore(url: str) -> tuple | None:
-            async with semaphore:
-                try:
-                    return await self.fetch(url, run_id)
-                except Exception as e:
-                    errors.append((url, str(e)))
-                    return None
+        fetch_results: list | None = None
+        try:
+            async with AsyncWebCrawler() as crawler:
 
-        tasks = [fetch_with_semaphore(url) for url in urls]
-        fetch_results = await asyncio.gather(*tasks)
+                async def fetch_with_semaphore(url: str) -> tuple[Source, str, str | None]:
+                    async with semaphore:
+                        return await self._fetch_one(crawler, url, run_id)
 
-        for result in fetch_results:
-            if result is not None:
+                fetch_results = await asyncio.gather(
+                    *(fetch_with_semaphore(url) for url in urls),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            if fetch_results is None:
+                # The crawler didn't start, so every URL failed
+                logger.error(f"Failed to start crawler: {e}")
+                fetch_results = [e] * len(urls)
+            else:
+                logger.warning(f"Failed to close crawler: {e}")
+
+        results = []
+        errors = []
+        for url, result in zip(urls, fetch_results):
+            if isinstance(result, BaseException):
+                errors.append((url, str(result)))
+            else:
                 results.append(result)
 
         if errors:
@@ -157,6 +139,82 @@ class URLFetcher:
 
         return results
 
+    async def _fetch_one(
+        self,
+        crawler: AsyncWebCrawler,
+        url: str,
+        run_id: UUID,
+        title: str | None = None,
+    ) -> tuple[Source, str, str | None]:
+        """
+        Fetch content from a URL with an already open crawler.
+
+        Args:
+            crawler: Open crawler to fetch with
+            url: URL to fetch
+            run_id: ID of the research run
+            title: Optional title override
+
+        Returns:
+            Tuple of (Source model, markdown content, HTML snapshot or None)
+
+        Raises:
+            ValueError: If URL is invalid or fetch fails
+        """
+        parsed = self._parse_url(url)
+
+        logger.info(f"Fetching URL: {url}")
+
+        try:
+            result = await crawler.arun(url=url)
+
+            if not result.success:
+                raise ValueError(f"Failed to fetch URL: {result.error_message}")
+
+            markdown = result.markdown or ""
+            html_snapshot = result.html if self.config.store_html_snapshots else None
+
+            # Extract or generate title
+            extracted_title = title or result.title or self._title_from_url(url)
+
+            # Calculate content hash
+            content_hash = self._calculate_hash(markdown)
+
+            # Create Source model
+            source = Source(
+                id=uuid4(),
+                run_id=run_id,
+                type="url",
+                title=extracted_title,
+                uri=url,
+                content_hash=content_hash,
+                metadata={
+                    "domain": parsed.netloc,
+                    "path": parsed.path,
+                    "captured_at": datetime.utcnow().isoformat(),
+                    "content_length": len(markdown),
+                    "has_html_snapshot": html_snapshot is not None,
+                },
+            )
+
+            logger.info(
+                f"Fetched URL: {extracted_title} "
+                f"({len(markdown)} chars from {parsed.netloc})"
+            )
+
+            return source, markdown, html_snapshot
+
+        except Exception as e:
+            logger.error(f"Failed to fetch URL {url}: {e}")
+            raise ValueError(f"Could not fetch URL content: {e}")
+
+    def _parse_url(self, url: str) -> ParseResult:
+        """Parse a URL, rejecting ones without a scheme or host."""
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            raise ValueError(f"Invalid URL: {url}")
+        return parsed
+
     def _title_from_url(self, url: str) -> str:
         """Extract a readable title from URL."""
         parsed = urlparse(url)
@@ -174,8 +232,12 @@ class URLFetcher:
         return parsed.netloc
 
     def _calculate_hash(self, content: str) -> str:
-        """Calculate SHA-256 hash of content."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        """Calculate SHA-256 hash of content (for deduplication, not security)."""
+        # Encode and hash in slices so large pages aren't copied to UTF-8 whole
+        digest = hashlib.sha256(usedforsecurity=False)
+        for start in range(0, len(content), _HASH_SLICE_CHARS):
+            digest.update(content[start:start + _HASH_SLICE_CHARS].encode("utf-8"))
+        return digest.hexdigest()
 
 
 class URLIngestionPipeline:
@@ -211,6 +273,7 @@ class URLIngestionPipeline:
         run_id: UUID,
         title: str | None = None,
         store: bool = True,
+        crawler: AsyncWebCrawler | None = None,
     ) -> tuple[Source, list[Chunk]]:
         """
         Ingest a URL: fetch, chunk, embed, and optionally store.
@@ -220,6 +283,8 @@ class URLIngestionPipeline:
             run_id: ID of the research run
             title: Optional title override
             store: Whether to store in database
+            crawler: Running crawler to fetch with (one is started for this
+                URL if not given)
 
         Returns:
             Tuple of (Source model, list of Chunk models)
@@ -229,7 +294,7 @@ class URLIngestionPipeline:
         from ingestion.embeddings import get_embedder
 
         # Fetch URL
-        source, markdown, html_snapshot = await self.fetcher.fetch(url, run_id, title)
+        source, markdown, html_snapshot = await self.fetcher.fetch(url, run_id, title, crawler)
 
         # Get chunker
         chunker = self._chunker or get_chunker(self.config)
@@ -261,28 +326,60 @@ class URLIngestionPipeline:
         urls: list[str],
         run_id: UUID,
         store: bool = True,
+        on_result: Callable[[str, Exception | None], None] | None = None,
     ) -> list[tuple[Source, list[Chunk]]]:
         """
-        Ingest multiple URLs.
+        Ingest multiple URLs concurrently.
+
+        All URLs share one crawler, so the browser starts once rather than
+        once per URL.
 
         Args:
             urls: List of URLs to ingest
             run_id: ID of the research run
             store: Whether to store in database
+            on_result: Called with each URL as it finishes, and the error if
+                it failed
 
         Returns:
-            List of (Source, chunks) tuples
+            List of (Source, chunks) tuples, in the order of ``urls``, for
+            the URLs that were ingested
         """
-        results = []
+        # Ingest concurrently, with a semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_fetches)
 
-        for url in urls:
-            try:
-                result = await self.ingest(url, run_id, store=store)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to ingest URL {url}: {e}")
+        async def ingest_with_semaphore(
+            crawler: AsyncWebCrawler, url: str
+        ) -> tuple[Source, list[Chunk]] | None:
+            async with semaphore:
+                result = error = None
+                try:
+                    result = await self.ingest(url, run_id, store=store, crawler=crawler)
+                except Exception as e:
+                    logger.error(f"Failed to ingest URL {url}: {e}")
+                    error = e
+                if on_result:
+                    on_result(url, error)
+                return result
 
-        return results
+        results: list | None = None
+        try:
+            async with AsyncWebCrawler() as crawler:
+                results = await asyncio.gather(
+                    *(ingest_with_semaphore(crawler, url) for url in urls)
+                )
+        except Exception as e:
+            if results is not None:
+                logger.warning(f"Failed to close crawler: {e}")
+            else:
+                # The crawler didn't start, so every URL failed
+                logger.error(f"Failed to start crawler: {e}")
+                if on_result:
+                    for url in urls:
+                        on_result(url, e)
+                return []
+
+        return [result for result in results if result is not None]
 
 
 async def ingest_url(
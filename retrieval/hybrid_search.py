@@ -14,7 +14,7 @@ from uuid import UUID
 from ingestion.embeddings import EmbeddingClient
 from schemas.config import RetrievalConfig, get_settings
 from schemas.models import SearchResult
-from storage.supabase import SupabaseClient, get_supabase_client
+from storage.supabase import SupabaseClient, execute_query, get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -121,7 +121,7 @@ class HybridSearcher:
             params["run_filter"] = str(run_id)
 
         # Execute vector search
-        result = self.client.client.rpc("match_chunks", params).execute()
+        result = await execute_query(self.client.client.rpc("match_chunks", params))
 
         # Convert to SearchResult models
         results = []
@@ -174,7 +174,7 @@ class HybridSearcher:
             params["run_filter"] = str(run_id)
 
         # Execute keyword search
-        result = self.client.client.rpc("search_chunks_keyword", params).execute()
+        result = await execute_query(self.client.client.rpc("search_chunks_keyword", params))
 
         # Convert to SearchResult models
         results = []
@@ -284,11 +284,10 @@ class HybridSearcher:
         if source_id in self._source_cache:
             return self._source_cache[source_id]
 
-        result = (
+        result = await execute_query(
             self.client.client.table("sources")
             .select("title, uri")
             .eq("id", str(source_id))
-            .execute()
         )
 
         if result.data:
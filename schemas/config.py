@@ -70,6 +70,19 @@ class IngestionConfig(BaseModel):
         default=True,
         description="Whether to use contextual embeddings for improved retrieval",
     )
+    max_concurrent_embedding_batches: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Embedding requests in flight at once while embedding a document",
+    )
+
+    max_concurrent_fetches: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="URLs fetched and ingested at once",
+    )
 
     # Storage settings
     store_html_snapshots: bool = Field(
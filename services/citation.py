@@ -18,6 +18,16 @@ from schemas.models import Citation, CitationAnchor, Chunk, Source
 
 logger = logging.getLogger(__name__)
 
+# Everything calculate_coverage looks for, as one alternation so the
+# document is scanned once. Only one group matches per hit.
+_COVERAGE_RE = re.compile(
+    r'(?P<split>[.!?]\s+)'
+    r'|(?P<cite>\[\d+\])'
+    r'|(?P<assume>\[ASSUMPTION:)'
+    r'|(?P<placeholder>\[cite:[a-f0-9-]+\])'
+    r'|(?P<num>\d+%|\$\d+|\d+\s*(?i:million|billion|thousand|percent))'
+)
+
 
 @dataclass
 class ResolvedCitation:
@@ -246,42 +256,57 @@ class CitationService:
         Returns:
             CitationReport with metrics
         """
-        # Split into sentences
-        sentences = re.split(r'[.!?]\s+', content)
-        total = len(sentences)
-
         cited = 0
         assumptions = 0
         numerical = 0
         numerical_cited = 0
         issues = []
 
-        for i, sentence in enumerate(sentences):
-            has_citation = bool(re.search(r'\[\d+\]', sentence))
-            has_assumption = bool(re.search(r'\[ASSUMPTION:', sentence))
-            has_placeholder = bool(re.search(r'\[cite:[a-f0-9-]+\]', sentence))
-            has_numbers = bool(re.search(
-                r'\d+%|\$\d+|\d+\s*(million|billion|thousand|percent)',
-                sentence,
-                re.IGNORECASE
-            ))
+        # Single pass: sentences are delimited by "split" matches, and the
+        # flags for the current sentence are tallied when it ends
+        index = 0
+        sentence_start = 0
+        has_citation = has_assumption = has_placeholder = has_numbers = False
+
+        def end_sentence(sentence_end: int) -> None:
+            nonlocal cited, assumptions, numerical, numerical_cited
 
             if has_citation:
                 cited += 1
             if has_assumption:
                 assumptions += 1
             if has_placeholder:
-                issues.append(f"Unresolved placeholder in sentence {i + 1}")
+                issues.append(f"Unresolved placeholder in sentence {index + 1}")
             if has_numbers:
                 numerical += 1
                 if has_citation or has_assumption:
                     numerical_cited += 1
                 else:
+                    sentence = content[sentence_start:sentence_end]
                     issues.append(
-                        f"Numerical claim without citation in sentence {i + 1}: "
+                        f"Numerical claim without citation in sentence {index + 1}: "
                         f"'{sentence[:50]}...'"
                     )
 
+        for match in _COVERAGE_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == "split":
+                end_sentence(match.start())
+                index += 1
+                sentence_start = match.end()
+                has_citation = has_assumption = has_placeholder = has_numbers = False
+            elif kind == "cite":
+                has_citation = True
+            elif kind == "assume":
+                has_assumption = True
+            elif kind == "placeholder":
+                has_placeholder = True
+            else:
+                has_numbers = True
+
+        end_sentence(len(content))
+        total = index + 1
+
         coverage = (cited + assumptions) / total * 100 if total > 0 else 0
 
         return CitationReport(
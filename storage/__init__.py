@@ -9,7 +9,7 @@ Modules:
 - vector: pgvector search operations
 """
 
-from storage.supabase import SupabaseClient, get_supabase_client
+from storage.supabase import SupabaseClient, execute_query, get_supabase_client
 from storage.vector import (
     HybridSearch,
     KeywordSearch,
@@ -22,6 +22,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Supabase
     "SupabaseClient",
+    "execute_query",
     "get_supabase_client",
     # Vector Search
     "VectorSearch",
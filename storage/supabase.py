@@ -7,8 +7,10 @@ This module provides:
 - Object storage for PDFs and HTML snapshots
 """
 
+import asyncio
 import json
 import logging
+from array import array
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -28,6 +30,36 @@ from schemas.models import (
 
 logger = logging.getLogger(__name__)
 
+# Chunk columns other than the embedding vector, for reads that only display chunks
+_CHUNK_DISPLAY_COLUMNS = (
+    "id,source_id,run_id,chunk_index,content,contextual_prefix,page_start,page_end,"
+    "section_hint,heading_hierarchy,content_hash,token_count,chunk_method,metadata"
+)
+
+
+async def execute_query(query: Any) -> Any:
+    """
+    Run a query's blocking ``execute()`` on a worker thread.
+
+    supabase-py's Client is synchronous, so each call is a blocking HTTP round
+    trip; awaiting it here keeps the event loop (which the UI shares between
+    sessions) free to serve other requests meanwhile.
+    """
+    return await asyncio.to_thread(query.execute)
+
+
+def _vector_literal(embedding: list[float] | None) -> str | None:
+    """
+    Format an embedding as a pgvector literal at float32 precision.
+
+    The column stores float32: values are rounded to float32 first, and 9
+    significant digits round-trip any float32, so the shorter text stores
+    exactly what the full-precision JSON would have.
+    """
+    if embedding is None:
+        return None
+    return "[" + ",".join(format(value, ".9g") for value in array("f", embedding)) + "]"
+
 
 class SupabaseClient:
     """
@@ -95,7 +127,7 @@ class SupabaseClient:
             "config": config.model_dump(),
         }
 
-        result = self.client.table("runs").insert(data).execute()
+        result = await execute_query(self.client.table("runs").insert(data))
 
         if not result.data:
             raise ValueError("Failed to create run")
@@ -122,11 +154,10 @@ class SupabaseClient:
         Returns:
             Run model or None if not found
         """
-        result = (
+        result = await execute_query(
             self.client.table("runs")
             .select("*")
             .eq("id", str(run_id))
-            .execute()
         )
 
         if not result.data:
@@ -159,12 +190,11 @@ class SupabaseClient:
         Returns:
             List of Run models
         """
-        result = (
+        result = await execute_query(
             self.client.table("runs")
             .select("*")
             .order("created_at", desc=True)
             .range(offset, offset + limit - 1)
-            .execute()
         )
 
         return [
@@ -193,9 +223,9 @@ class SupabaseClient:
             run_id: Run ID
             status: New status
         """
-        self.client.table("runs").update({"status": status}).eq(
-            "id", str(run_id)
-        ).execute()
+        await execute_query(
+            self.client.table("runs").update({"status": status}).eq("id", str(run_id))
+        )
 
     async def delete_run(self, run_id: UUID) -> None:
         """
@@ -204,7 +234,7 @@ class SupabaseClient:
         Args:
             run_id: Run ID
         """
-        self.client.table("runs").delete().eq("id", str(run_id)).execute()
+        await execute_query(self.client.table("runs").delete().eq("id", str(run_id)))
 
     # =========================================================================
     # SOURCES
@@ -231,25 +261,26 @@ class SupabaseClient:
             "metadata": source.metadata,
         }
 
-        self.client.table("sources").insert(data).execute()
+        await execute_query(self.client.table("sources").insert(data))
         return source
 
-    async def get_sources(self, run_id: UUID) -> list[Source]:
+    async def get_sources(self, run_id: UUID, limit: int | None = None) -> list[Source]:
         """
-        Get all sources for a run.
+        Get sources for a run.
 
         Args:
             run_id: Run ID
+            limit: Maximum number of sources to return, oldest first (all if None)
 
         Returns:
             List of Source models
         """
-        result = (
-            self.client.table("sources")
-            .select("*")
-            .eq("run_id", str(run_id))
-            .execute()
-        )
+        query = self.client.table("sources").select("*").eq("run_id", str(run_id))
+
+        if limit is not None:
+            query = query.order("captured_at").order("id").limit(limit)
+
+        result = await execute_query(query)
 
         return [
             Source(
@@ -265,6 +296,24 @@ class SupabaseClient:
             for s in result.data
         ]
 
+    async def get_source_count(self, run_id: UUID) -> int:
+        """
+        Count sources for a run.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Number of sources
+        """
+        result = await execute_query(
+            self.client.table("sources")
+            .select("id", count="exact", head=True)
+            .eq("run_id", str(run_id))
+        )
+
+        return result.count or 0
+
     # =========================================================================
     # CHUNKS
     # =========================================================================
@@ -272,11 +321,15 @@ class SupabaseClient:
     async def store_chunks(
         self,
         chunks: list[Chunk],
-        batch_size: int = 50,
+        batch_size: int = 100,
     ) -> None:
         """
         Store chunks in the database.
 
+        Each batch is one multi-row insert. Embeddings are sent as float32
+        precision pgvector literals, about 20 KB per 1536-dim row, so 100
+        rows keeps a request body around 2 MB.
+
         Args:
             chunks: List of Chunk models
             batch_size: Batch size for insertion
@@ -299,13 +352,13 @@ class SupabaseClient:
                     "content_hash": chunk.content_hash,
                     "token_count": chunk.token_count,
                     "chunk_method": chunk.chunk_method,
-                    "embedding": chunk.embedding,
+                    "embedding": _vector_literal(chunk.embedding),
                     "metadata": chunk.metadata,
                 }
                 for chunk in batch
             ]
 
-            self.client.table("chunks").insert(data).execute()
+            await execute_query(self.client.table("chunks").insert(data))
 
         logger.info(f"Stored {len(chunks)} chunks")
 
@@ -313,6 +366,9 @@ class SupabaseClient:
         self,
         run_id: UUID,
         source_id: UUID | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        with_embedding: bool = True,
     ) -> list[Chunk]:
         """
         Get chunks for a run, optionally filtered by source.
@@ -320,20 +376,29 @@ class SupabaseClient:
         Args:
             run_id: Run ID
             source_id: Optional source ID filter
+            limit: Maximum number of chunks to return (all if None)
+            offset: Offset for pagination
+            with_embedding: Whether to fetch the embedding vectors
 
         Returns:
             List of Chunk models
         """
         query = (
             self.client.table("chunks")
-            .select("*")
+            .select("*" if with_embedding else _CHUNK_DISPLAY_COLUMNS)
             .eq("run_id", str(run_id))
         )
 
         if source_id:
             query = query.eq("source_id", str(source_id))
 
-        result = query.order("chunk_index").execute()
+        query = query.order("chunk_index")
+
+        if limit is not None:
+            # Break chunk_index ties so pages don't overlap across sources
+            query = query.order("id").range(offset, offset + limit - 1)
+
+        result = await execute_query(query)
 
         return [
             Chunk(
@@ -356,6 +421,34 @@ class SupabaseClient:
             for c in result.data
         ]
 
+    async def get_chunk_count(
+        self,
+        run_id: UUID,
+        source_id: UUID | None = None,
+    ) -> int:
+        """
+        Count chunks for a run, optionally filtered by source.
+
+        Args:
+            run_id: Run ID
+            source_id: Optional source ID filter
+
+        Returns:
+            Number of matching chunks
+        """
+        query = (
+            self.client.table("chunks")
+            .select("id", count="exact", head=True)
+            .eq("run_id", str(run_id))
+        )
+
+        if source_id:
+            query = query.eq("source_id", str(source_id))
+
+        result = await execute_query(query)
+
+        return result.count or 0
+
     async def get_chunk(self, chunk_id: UUID) -> Chunk | None:
         """
         Get a single chunk by ID.
@@ -366,11 +459,10 @@ class SupabaseClient:
         Returns:
             Chunk model or None
         """
-        result = (
+        result = await execute_query(
             self.client.table("chunks")
             .select("*")
             .eq("id", str(chunk_id))
-            .execute()
         )
 
         if not result.data:
@@ -419,7 +511,7 @@ class SupabaseClient:
             "config_snapshot": document.config_snapshot.model_dump(),
         }
 
-        self.client.table("documents").insert(data).execute()
+        await execute_query(self.client.table("documents").insert(data))
         return document
 
     async def get_document(
@@ -448,7 +540,7 @@ class SupabaseClient:
         else:
             query = query.order("version", desc=True).limit(1)
 
-        result = query.execute()
+        result = await execute_query(query)
 
         if not result.data:
             return None
@@ -475,12 +567,11 @@ class SupabaseClient:
         Returns:
             List of Document models ordered by version
         """
-        result = (
+        result = await execute_query(
             self.client.table("documents")
             .select("*")
             .eq("run_id", str(run_id))
             .order("version")
-            .execute()
         )
 
         return [
@@ -520,7 +611,7 @@ class SupabaseClient:
             for c in citations
         ]
 
-        self.client.table("citations").insert(data).execute()
+        await execute_query(self.client.table("citations").insert(data))
 
     async def get_citations(self, document_id: UUID) -> list[Citation]:
         """
@@ -534,11 +625,10 @@ class SupabaseClient:
         """
         from schemas.models import CitationAnchor
 
-        result = (
+        result = await execute_query(
             self.client.table("citations")
             .select("*")
             .eq("document_id", str(document_id))
-            .execute()
         )
 
         return [
@@ -580,12 +670,13 @@ class SupabaseClient:
             "payload": payload or {},
         }
 
-        self.client.table("events").insert(data).execute()
+        await execute_query(self.client.table("events").insert(data))
 
     async def get_events(
         self,
         run_id: UUID,
         event_type: str | None = None,
+        since: datetime | None = None,
     ) -> list[Event]:
         """
         Get events for a run.
@@ -593,6 +684,7 @@ class SupabaseClient:
         Args:
             run_id: Run ID
             event_type: Optional event type filter
+            since: Only return events at or after this timestamp
 
         Returns:
             List of Event models
@@ -606,7 +698,10 @@ class SupabaseClient:
         if event_type:
             query = query.eq("type", event_type)
 
-        result = query.order("ts").execute()
+        if since:
+            query = query.gte("ts", since.isoformat())
+
+        result = await execute_query(query.order("ts"))
 
         return [
             Event(
@@ -645,7 +740,8 @@ class SupabaseClient:
         storage_path = f"{source_id}.pdf"
 
         with open(file_path, "rb") as f:
-            self.client.storage.from_(bucket).upload(
+            await asyncio.to_thread(
+                self.client.storage.from_(bucket).upload,
                 storage_path,
                 f.read(),
                 {"content-type": "application/pdf"},
@@ -671,7 +767,8 @@ class SupabaseClient:
         bucket = "snapshots"
         storage_path = f"{source_id}.html"
 
-        self.client.storage.from_(bucket).upload(
+        await asyncio.to_thread(
+            self.client.storage.from_(bucket).upload,
             storage_path,
             html.encode("utf-8"),
             {"content-type": "text/html"},
@@ -13,7 +13,7 @@ from uuid import UUID
 from ingestion.embeddings import EmbeddingClient
 from schemas.config import RetrievalConfig, get_settings
 from schemas.models import SearchResult
-from storage.supabase import get_supabase_client
+from storage.supabase import execute_query, get_supabase_client
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ class VectorSearch:
         if run_id:
             params["run_filter"] = str(run_id)
 
-        result = self.client.client.rpc("match_chunks", params).execute()
+        result = await execute_query(self.client.client.rpc("match_chunks", params))
 
         # Get source information for results
         results = []
@@ -93,11 +93,10 @@ class VectorSearch:
 
     async def _get_source_info(self, source_id: UUID) -> dict:
         """Get source title and URI."""
-        result = (
+        result = await execute_query(
             self.client.client.table("sources")
             .select("title, uri")
             .eq("id", str(source_id))
-            .execute()
         )
 
         if result.data:
@@ -148,7 +147,7 @@ class KeywordSearch:
         if run_id:
             params["run_filter"] = str(run_id)
 
-        result = self.client.client.rpc("search_chunks_keyword", params).execute()
+        result = await execute_query(self.client.client.rpc("search_chunks_keyword", params))
 
         # Get source information for results
         results = []
@@ -176,11 +175,10 @@ class KeywordSearch:
 
     async def _get_source_info(self, source_id: UUID) -> dict:
         """Get source title and URI."""
-        result = (
+        result = await execute_query(
             self.client.client.table("sources")
             .select("title, uri")
             .eq("id", str(source_id))
-            .execute()
         )
 
         if result.data:
@@ -0,0 +1,4 @@
+-- Lets /worker/lease find the oldest queued job without scanning finished ones
+create index if not exists jobs_queued_created_at_idx
+on jobs (created_at)
+where status = 'queued';
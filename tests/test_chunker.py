@@ -0,0 +1,226 @@
+"""Markdown chunk boundaries and time-ordered chunk IDs."""
+
+import re
+import time
+from datetime import datetime
+from uuid import RFC_4122, uuid4
+
+import pytest
+
+chunker_module = pytest.importorskip("ingestion.chunker")
+
+from schemas.config import IngestionConfig  # noqa: E402
+from schemas.models import Source  # noqa: E402
+
+MAX_TOKENS = 100
+
+
+class WhitespaceTokenizer:
+    """One token per whitespace-separated word, plus [CLS] and [SEP]."""
+
+    def __call__(self, texts, add_special_tokens=True, return_length=False):
+        special = self.num_special_tokens_to_add() if add_special_tokens else 0
+        return {"length": [len(text.split()) + special for text in texts]}
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def encode(self, text):
+        return [0] * (len(text.split()) + self.num_special_tokens_to_add())
+
+
+def reference_chunks(content, max_tokens, encode):
+    """
+    The chunker as it was before batching: accumulate lines, encoding each one,
+    and flush when the next line or code block would overflow ``max_tokens``.
+    """
+    if not content.strip():
+        return []
+
+    chunks = []
+    current, current_tokens, hierarchy = [], 0, []
+
+    def flush(lines):
+        chunks.append(("\n".join(lines).strip(), hierarchy.copy()))
+
+    lines = content.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if line.strip().startswith("```"):
+            block = [line]
+            i += 1
+            while i < len(lines):
+                block.append(lines[i])
+                if lines[i].strip().startswith("```"):
+                    break
+                i += 1
+            code = "\n".join(block)
+            code_tokens = len(encode(code))
+
+            if code_tokens > max_tokens:
+                if current:
+                    flush(current)
+                    current, current_tokens = [], 0
+                piece, piece_tokens = [], 0
+                for code_line in block:
+                    tokens = len(encode(code_line))
+                    if piece_tokens + tokens > max_tokens and piece:
+                        flush(["\n".join(piece)])
+                        piece, piece_tokens = [], 0
+                    piece.append(code_line)
+                    piece_tokens += tokens
+                flush(["\n".join(piece)])
+            else:
+                if current_tokens + code_tokens > max_tokens and current:
+                    flush(current)
+                    current, current_tokens = [], 0
+                current.append(code)
+                current_tokens += code_tokens
+
+            i += 1
+            continue
+
+        heading = re.match(r"^(#{1,6})\s+(.+)$", line)
+        if heading:
+            hierarchy = hierarchy[: len(heading.group(1)) - 1]
+            hierarchy.append(heading.group(2).strip())
+
+        line_tokens = len(encode(line))
+        if current_tokens + line_tokens > max_tokens and current:
+            flush(current)
+            current, current_tokens = [], 0
+        current.append(line)
+        current_tokens += line_tokens
+        i += 1
+
+    if current:
+        flush(current)
+    return chunks
+
+
+@pytest.fixture
+def chunker():
+    chunker = chunker_module.DoclingHybridChunker(IngestionConfig(chunk_size_tokens=MAX_TOKENS))
+    chunker.tokenizer = WhitespaceTokenizer()
+    return chunker
+
+
+@pytest.fixture
+def source():
+    return Source(
+        run_id=uuid4(),
+        type="url",
+        title="Test page",
+        uri="https://example.com",
+        captured_at=datetime.now(),
+        content_hash="0" * 64,
+    )
+
+
+def words(n, word="word"):
+    return " ".join([word] * n)
+
+
+async def assert_matches_reference(chunker, source, content):
+    chunks = await chunker.chunk_markdown(content, source)
+    expected = reference_chunks(content, MAX_TOKENS, chunker.tokenizer.encode)
+
+    assert [(c.content, c.heading_hierarchy) for c in chunks] == expected
+    assert [c.chunk_index for c in chunks] == list(range(len(expected)))
+    for chunk in chunks:
+        assert chunk.token_count == len(chunker.tokenizer.encode(chunk.content))
+        assert chunk.section_hint == (chunk.heading_hierarchy[-1] if chunk.heading_hierarchy else None)
+    return chunks
+
+
+async def test_headings(chunker, source):
+    content = "\n".join([
+        "# Title",
+        words(30),
+        "## Background",
+        words(40),
+        words(40),
+        "### Detail",
+        words(20),
+        "## Method",
+        words(60),
+        "# Appendix",
+        words(10),
+    ])
+
+    chunks = await assert_matches_reference(chunker, source, content)
+
+    assert len(chunks) > 1
+    assert chunks[-1].heading_hierarchy == ["Appendix"]
+
+
+async def test_code_block_longer_than_max_tokens(chunker, source):
+    code = "\n".join(["```python", *(words(10, "code") for _ in range(30)), "```"])
+    content = "\n".join(["# Code", words(30), code, words(10)])
+
+    chunks = await assert_matches_reference(chunker, source, content)
+
+    # The block is split at line boundaries into several chunks
+    assert sum("code" in c.content for c in chunks) > 1
+
+
+async def test_unterminated_code_block(chunker, source):
+    content = "\n".join(["intro", "```", *(words(30) for _ in range(10))])
+
+    await assert_matches_reference(chunker, source, content)
+
+
+async def test_code_block_that_fits(chunker, source):
+    code = "\n".join(["```", words(20), words(20), "```"])
+    content = "\n".join([words(70), code, words(5)])
+
+    await assert_matches_reference(chunker, source, content)
+
+
+async def test_whitespace_only_sections(chunker, source):
+    content = "\n".join([
+        "# Empty",
+        "",
+        "   ",
+        "\t",
+        "## Also empty",
+        "",
+        "",
+        "## Text",
+        words(90),
+        "  ",
+        words(30),
+    ])
+
+    await assert_matches_reference(chunker, source, content)
+
+
+async def test_whitespace_only_document(chunker, source):
+    assert await chunker.chunk_markdown(" \n\t\n  \n", source) == []
+
+
+def test_uuid7_version_and_variant_bits():
+    for _ in range(100):
+        value = chunker_module._uuid7()
+        assert value.version == 7
+        assert value.variant == RFC_4122
+
+
+def test_uuid7_leads_with_millisecond_timestamp():
+    before = time.time_ns() // 1_000_000
+    value = chunker_module._uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_orders_by_creation_time():
+    ids = []
+    for _ in range(5):
+        ids.append(chunker_module._uuid7())
+        time.sleep(0.002)
+
+    assert ids == sorted(ids)
+    assert [str(i) for i in ids] == sorted(str(i) for i in ids)
@@ -0,0 +1,184 @@
+"""Batch packing, deduplication and adaptive concurrency for embeddings."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+embeddings_module = pytest.importorskip("ingestion.embeddings")
+
+
+def vector_for(text):
+    """A distinct, recognizable embedding for each text."""
+    return [float(len(text)), float(sum(map(ord, text)))]
+
+
+class FakeEmbeddings:
+    """Stands in for ``AsyncOpenAI().embeddings``, recording each request."""
+
+    def __init__(self, fail_on=()):
+        self.requests = []
+        self.fail_on = set(fail_on)
+
+    async def create(self, model, input):
+        self.requests.append(list(input))
+        if self.fail_on.intersection(input):
+            raise RuntimeError("server error")
+        return SimpleNamespace(data=[SimpleNamespace(embedding=vector_for(text)) for text in input])
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(embeddings_module, "_embedding_cache", embeddings_module._EmbeddingCache(1024))
+
+
+def make_client(fake):
+    client = embeddings_module.EmbeddingClient(api_key="test")
+    client.client = SimpleNamespace(embeddings=fake)
+    client.encoding = None  # estimate tokens as len(text) // 3 + 1
+    return client
+
+
+async def test_batches_stay_under_token_and_item_limits():
+    fake = FakeEmbeddings()
+    client = make_client(fake)
+    texts = [f"text {i} " + "x" * (i * 7 % 60) for i in range(40)]
+
+    result = await client.embed_batched(texts, batch_size=5, max_batch_tokens=40)
+
+    assert result == [vector_for(text) for text in texts]
+    assert len(fake.requests) > 1
+    for request in fake.requests:
+        assert len(request) <= 5
+        tokens = client.count_tokens(request)
+        assert sum(tokens) <= 40 or len(request) == 1
+    assert sorted(text for request in fake.requests for text in request) == sorted(texts)
+
+
+async def test_text_over_token_limit_is_sent_alone():
+    fake = FakeEmbeddings()
+    client = make_client(fake)
+    texts = ["short", "y" * 300, "also short"]
+
+    result = await client.embed_batched(texts, max_batch_tokens=50)
+
+    assert result == [vector_for(text) for text in texts]
+    assert ["y" * 300] in fake.requests
+
+
+async def test_duplicates_are_embedded_once_and_mapped_back():
+    fake = FakeEmbeddings()
+    client = make_client(fake)
+    texts = ["header", "alpha", "header", "beta", "alpha", "footer", "header"]
+
+    result = await client.embed_batched(texts, batch_size=2)
+
+    assert result == [vector_for(text) for text in texts]
+    sent = [text for request in fake.requests for text in request]
+    assert sorted(sent) == ["alpha", "beta", "footer", "header"]
+
+
+async def test_failed_batch_leaves_its_positions_empty():
+    fake = FakeEmbeddings(fail_on={"bad"})
+    client = make_client(fake)
+    texts = ["good", "bad", "other", "bad", "fine"]
+
+    result = await client.embed_batched(texts, batch_size=1)
+
+    assert result == [
+        vector_for("good"),
+        None,
+        vector_for("other"),
+        None,
+        vector_for("fine"),
+    ]
+
+
+def rate_limit_error():
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    return openai.RateLimitError(
+        "rate limited", response=httpx.Response(429, request=request), body=None
+    )
+
+
+async def test_limiter_halves_on_rate_limit_down_to_one():
+    limiter = embeddings_module._AdaptiveLimiter(initial=8, maximum=8)
+
+    windows = []
+    for _ in range(5):
+        with pytest.raises(openai.RateLimitError):
+            async with limiter.slot():
+                raise rate_limit_error()
+        windows.append(limiter.window)
+
+    assert windows == [4, 2, 1, 1, 1]
+
+
+async def test_limiter_recovers_additively_up_to_maximum():
+    limiter = embeddings_module._AdaptiveLimiter(initial=2, maximum=4)
+
+    windows = [limiter.window]
+    for _ in range(20):
+        async with limiter.slot():
+            pass
+        windows.append(limiter.window)
+
+    # About one more slot per window's worth of successes, never past maximum
+    assert windows[1] == 2.5
+    assert int(windows[2]) == 2
+    assert int(windows[3]) == 3
+    assert windows == sorted(windows)
+    assert windows[-1] == 4
+
+
+async def test_limiter_caps_requests_in_flight():
+    limiter = embeddings_module._AdaptiveLimiter(initial=3, maximum=3)
+    in_flight = peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        async with limiter.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(12)))
+
+    assert peak == 3
+
+
+async def test_limiter_settles_under_a_simulated_rate_limit():
+    # The "server" rejects requests while more than `capacity` are in flight
+    capacity = 3
+    limiter = embeddings_module._AdaptiveLimiter(initial=16, maximum=16)
+    in_flight = 0
+    rate_limited = 0
+    peaks = []
+
+    async def request():
+        nonlocal in_flight, rate_limited
+        while True:
+            try:
+                async with limiter.slot():
+                    in_flight += 1
+                    peaks.append(in_flight)
+                    try:
+                        await asyncio.sleep(0.001)
+                        if in_flight > capacity:
+                            rate_limited += 1
+                            raise rate_limit_error()
+                    finally:
+                        in_flight -= 1
+                return
+            except openai.RateLimitError:
+                pass
+
+    await asyncio.gather(*(request() for _ in range(200)))
+
+    assert rate_limited > 0
+    assert limiter.window < 16
+    # Once the window has shrunk, it stays near what the server allows
+    assert max(peaks[-50:]) <= 2 * capacity
@@ -0,0 +1,37 @@
+"""pgvector literals for chunk embeddings."""
+
+import random
+from array import array
+
+import pytest
+
+supabase_module = pytest.importorskip("storage.supabase")
+
+
+def parse(literal):
+    assert literal.startswith("[") and literal.endswith("]")
+    return [float(value) for value in literal[1:-1].split(",")]
+
+
+def test_vector_literal_round_trips_float32():
+    rng = random.Random(0)
+    embedding = [rng.uniform(-1, 1) for _ in range(1536)]
+    embedding += [0.0, -0.0, 1 / 3, 1e-38, -3.4e38, 1.5e-45, 123456.789]
+
+    parsed = parse(supabase_module._vector_literal(embedding))
+
+    # Each value reads back as exactly the float32 the column would store
+    assert array("f", parsed) == array("f", embedding)
+
+
+def test_vector_literal_is_shorter_than_full_precision():
+    rng = random.Random(1)
+    embedding = [rng.uniform(-1, 1) for _ in range(1536)]
+
+    literal = supabase_module._vector_literal(embedding)
+
+    assert len(literal) < len(str(embedding))
+
+
+def test_vector_literal_passes_through_missing_embedding():
+    assert supabase_module._vector_literal(None) is None